@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from ..tools.office_tools import OfficeToolRegistry, Tool
+from ..core.gemini_cache import gemini_model
+from ..core.hedging import first_success
+from ..core.llm_cache import DEFAULT_TTL_SECONDS, LLMCache, get_llm_cache
+from ..tools.office_tools import OfficeToolRegistry, Tool, get_registry
+from ..utils.json_extract import extract_first_json_object
 from ..utils.logger import get_logger
 from ..utils.metrics import Metrics
 
 
+class ToolNotFoundError(AttributeError):
+    """A `_t_<tool>` attribute was looked up for a tool missing from the registry."""
+
+
 class BaseOfficeAgent:
     """Base class for specialized agents.
 
@@ -14,17 +27,19 @@ class BaseOfficeAgent:
     They may override `execute` for custom behaviors.
     """
 
-    def __init__(self, registry: Optional[OfficeToolRegistry] = None, name: Optional[str] = None) -> None:
+    def __init__(self, registry: Optional[OfficeToolRegistry] = None, name: Optional[str] = None, config=None) -> None:
         self.name = name or self.__class__.__name__
+        self.config = config
         self.logger = get_logger(self.name)
         self.metrics = Metrics()
-        self.registry = registry or OfficeToolRegistry()
+        self.registry = registry or get_registry()
         self._tool_names = self._initialize_tools()
-        self._tool_map: Dict[str, Tool] = {}
-        for n in self._tool_names:
-            t = self.registry.get_tool(n)
-            if t:
-                self._tool_map[n] = t
+        self._tool_map: Dict[str, Tool] = self.registry.get_tools(self._tool_names)
+        # Per-thread event sink set by execute_streaming; see _emit()
+        self._stream = threading.local()
+        # Bind tools as attributes (self._t_<name>) so execute() does a plain attribute load
+        for n, t in self._tool_map.items():
+            setattr(self, f"_t_{n}", t)
 
     # ---- subclass API ----
     def _initialize_tools(self) -> List[str]:  # pragma: no cover - abstract
@@ -33,20 +48,180 @@ class BaseOfficeAgent:
     def _get_system_prompt(self) -> str:  # pragma: no cover - abstract
         return ""
 
+    def __getattr__(self, name: str):
+        # Only reached when normal lookup fails, i.e. for a _t_<tool> missing from the registry
+        if name.startswith("_t_"):
+            # AttributeError subclass so hasattr()/getattr(..., default) keep working
+            raise ToolNotFoundError(f"tool not found: {name[3:]}", name=name, obj=self)
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
     # ---- helpers ----
-    def _tool(self, name: str) -> Tool:
-        t = self._tool_map.get(name) or self.registry.get_tool(name)
-        if not t:
-            raise RuntimeError(f"tool not found: {name}")
-        return t
+    def _run_tool_batch(
+        self,
+        tool: Tool,
+        calls: List[Dict[str, Any]],
+        progress: Optional[Callable[[int, Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Invoke `tool` once per kwargs dict and return error events instead of raising.
+
+        Calls run on a thread pool (TOOL_CONCURRENCY_LIMIT workers, default 8) when
+        `config.flags.parallel_tools` is set and the tool is declared thread-safe;
+        otherwise they run serially in order. When streaming, `progress(i, kwargs)`
+        builds the event emitted as soon as call `i` succeeds.
+        """
+        # Pool threads have no sink of their own; capture the caller's
+        sink = getattr(self._stream, "sink", None) if progress is not None else None
+
+        def call(i: int, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            try:
+                out = tool(**kwargs)
+            except Exception as e:
+                return {"event": "error", "tool": tool.name, "args": kwargs, "error": str(e)}
+            if isinstance(out, dict) and out.get("status") == "error":
+                return {"event": "error", "tool": tool.name, "args": kwargs, "error": out.get("error")}
+            if sink is not None:
+                sink(progress(i, kwargs))
+            return None
+
+        parallel = bool(self.config is not None and self.config.flags and self.config.flags.parallel_tools)
+        if parallel and tool.thread_safe and len(calls) > 1:
+            workers = max(1, min(int(os.getenv("TOOL_CONCURRENCY_LIMIT", "8")), len(calls)))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                results = list(ex.map(call, range(len(calls)), calls))
+        else:
+            results = [call(i, c) for i, c in enumerate(calls)]
+        return [r for r in results if r is not None]
+
+    def _streaming(self) -> bool:
+        """True while running under execute_streaming(); lets callers skip building events."""
+        return getattr(self._stream, "sink", None) is not None
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        """Forward a progress event to the execute_streaming() consumer, if any."""
+        sink = getattr(self._stream, "sink", None)
+        if sink is not None:
+            sink(event)
+
+    def _generate_with_fallbacks(
+        self, genai, kind: str, fallbacks: Sequence[str], primary: str, prompt: str, tail: str
+    ) -> Optional[dict]:
+        """Stream the fallback models as hedged requests and return the first parsed JSON object.
+
+        If no model has streamed its first chunk within `config.llm.hedge_stagger_ms`
+        (default 2000), the next one is launched, at most two at a time; once a model
+        is streaming no further hedges start, and a failure launches the next one at
+        once. Responses are streamed and parsing stops at the first balanced JSON object,
+        so the rest of the generation is not awaited; losing attempts stop reading
+        their stream at the next chunk once a winner is known. Chunks are emitted as
+        `llm_chunk` events to a streaming consumer, from one attempt only: the first
+        to stream claims the output. `llm_reset` (discard the deltas so far) is emitted
+        when that attempt fails, after which the next attempt to start streaming claims
+        it, or when another attempt wins. Nothing is forwarded after the result is decided.
+        """
+        # Hedged attempts run on pool threads; capture the caller's sink here
+        sink = getattr(self._stream, "sink", None)
+        # Set on the first streamed chunk: hedges race time-to-first-chunk, not completion
+        started = threading.Event()
+        # Set once first_success has returned: losers stop, nothing more is forwarded
+        finished = threading.Event()
+        # Model whose chunks are forwarded; hedged attempts must not interleave deltas.
+        # Emitting under the lock orders every event before the final llm_reset check.
+        owner_lock = threading.Lock()
+        owner: List[Optional[str]] = [None]
+
+        def attempt(model_name: str) -> Tuple[str, Optional[dict]]:
+            forward = False
+            try:
+                model, uses_cache = gemini_model(genai, kind, model_name, primary)
+                stream = model.generate_content(tail if uses_cache else prompt, stream=True)
+                parts: List[str] = []
+                for chunk in stream:
+                    if finished.is_set():
+                        break
+                    try:
+                        delta = chunk.text
+                    except ValueError:  # chunk without text parts (e.g. safety metadata)
+                        continue
+                    if not delta:
+                        continue
+                    if not parts and sink is not None:
+                        # Claim the output on the first chunk only, never mid-stream
+                        with owner_lock:
+                            if owner[0] is None:
+                                owner[0] = model_name
+                            forward = owner[0] == model_name
+                    parts.append(delta)
+                    started.set()
+                    if forward:
+                        with owner_lock:
+                            if not finished.is_set():
+                                sink({"event": "llm_chunk", "agent": self.name, "model": model_name, "delta": delta})
+                    if "}" in delta:
+                        data = self._extract_json("".join(parts))
+                        if data is not None:
+                            return model_name, data
+                return model_name, self._extract_json("".join(parts))
+            except Exception:
+                if forward:
+                    with owner_lock:
+                        if owner[0] == model_name and not finished.is_set():
+                            owner[0] = None
+                            sink({"event": "llm_reset", "agent": self.name, "model": model_name})
+                raise
+
+        stagger_ms = self.config.llm.hedge_stagger_ms if self.config is not None and self.config.llm else 2000
+        winner: Optional[str] = None
+        try:
+            winner, data = first_success([partial(attempt, m) for m in fallbacks], stagger_ms / 1000.0, started=started)
+        finally:
+            with owner_lock:
+                finished.set()
+                if sink is not None and owner[0] is not None and owner[0] != winner:
+                    # The deltas came from an attempt whose answer was discarded
+                    sink({"event": "llm_reset", "agent": self.name, "model": owner[0]})
+        return data
+
+    @staticmethod
+    def _extract_json(text: str) -> Optional[dict]:
+        return extract_first_json_object(text)
+
+    def _llm_cache(self) -> Optional[LLMCache]:
+        """Return the LLM response cache, or None when disabled via config or unavailable."""
+        ttl = self.config.llm.cache_ttl_seconds if self.config is not None and self.config.llm else DEFAULT_TTL_SECONDS
+        return get_llm_cache(int(ttl)) if ttl and int(ttl) > 0 else None
 
     # ---- execution ----
     def execute(self, task, context=None, user_id=None, task_id=None):  # pragma: no cover - to be overridden
         raise NotImplementedError
 
     def execute_streaming(self, task, context=None, user_id=None, task_id=None):  # pragma: no cover
-        # Minimal streaming wrapper around execute
+        """Run execute() on a worker thread and yield its progress events as they happen.
+
+        Subclasses report progress from execute() through `_emit` / `_run_tool_batch`
+        (e.g. `slide_added`, `cell_written`, `llm_chunk`); nothing is buffered here.
+        """
         yield {"event": "start", "agent": self.name}
-        result = self.execute(task, context=context, user_id=user_id, task_id=task_id)
-        yield {"event": "result", "result": result}
+        events: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        done = object()
+        outcome: Dict[str, Any] = {}
+
+        def run() -> None:
+            self._stream.sink = events.put
+            try:
+                outcome["result"] = self.execute(task, context=context, user_id=user_id, task_id=task_id)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                self._stream.sink = None
+                events.put(done)
+
+        threading.Thread(target=run, name=f"{self.name}-stream", daemon=True).start()
+        while True:
+            ev = events.get()
+            if ev is done:
+                break
+            yield ev
+        if "error" in outcome:
+            raise outcome["error"]
+        yield {"event": "result", "result": outcome["result"]}
         yield {"event": "end", "status": "completed"}
@@ -23,10 +23,10 @@ class CommunicationAgent(BaseOfficeAgent):
 
     def execute(self, task, context=None, user_id=None, task_id=None):
         title = (context or {}).get("title") or "Communication Summary"
-        create = self._tool("create_document")
-        add_h = self._tool("add_heading")
-        add_p = self._tool("add_paragraph")
-        save = self._tool("save_document")
+        create = self._t_create_document
+        add_h = self._t_add_heading
+        add_p = self._t_add_paragraph
+        save = self._t_save_document
         doc_id = create(title=title)["doc_id"]
         add_h(doc_id=doc_id, text=title)
         add_p(doc_id=doc_id, text=str(task))
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
 import os
-import re
 from typing import Any, Dict, List, Optional
 
+from ..core.gemini_cache import PREFIXES
+from ..core.gemini_client import DEFAULT_MODEL, get_fallbacks, get_genai
+from ..utils.fast_extract import extract_title_after
 from .base_agent import BaseOfficeAgent
 
+DEFAULT_TITLE = "Generated Document"
+
 
 class DocumentAgent(BaseOfficeAgent):
     """Word-focused agent that composes a simple document using tools."""
@@ -23,11 +26,11 @@ class DocumentAgent(BaseOfficeAgent):
         return "Create concise, well-structured documents with a clear heading and body."
 
     def execute(self, task, context=None, user_id=None, task_id=None):
-        title = (context or {}).get("title") or self._extract_title(str(task)) or "Generated Document"
-        create = self._tool("create_document")
-        add_h = self._tool("add_heading")
-        add_p = self._tool("add_paragraph")
-        save = self._tool("save_document")
+        title = (context or {}).get("title") or self._extract_title(str(task)) or DEFAULT_TITLE
+        create = self._t_create_document
+        add_h = self._t_add_heading
+        add_p = self._t_add_paragraph
+        save = self._t_save_document
 
         # Try Gemini for structured document content
         spec = self._generate_document_with_gemini(task=str(task), title=title)
@@ -58,67 +61,33 @@ class DocumentAgent(BaseOfficeAgent):
         if not api_key:
             return None
         try:
-            import google.generativeai as genai  # type: ignore
-
-            genai.configure(api_key=api_key)
-            primary = os.getenv("LLM_MODEL", "gemini-1.5-pro")
-            candidates = [primary, "gemini-2.5-flash", "gemini-2.0-flash", "gemini-1.5-flash", "gemini-1.5-pro"]
-            seen, fallbacks = set(), []
-            for m in candidates:
-                if m not in seen:
-                    seen.add(m)
-                    fallbacks.append(m)
+            genai = get_genai(api_key)
+            primary = os.getenv("LLM_MODEL") or DEFAULT_MODEL
+            fallbacks = get_fallbacks(primary)
 
-            prompt = (
-                "You are a writing assistant. Draft a short, clear document titled '"
-                + title
-                + "'. Return ONLY valid JSON with this schema and no extra text:\n"
-                "{\n  \"title\": \"Document Title\",\n  \"sections\": [\n    { \"heading\": \"Section Heading\", \"paragraphs\": [\"para1\", \"para2\"] },\n    ...\n  ]\n}\n"
-                f"Task: {task}"
-            )
-            last_err = None
-            for model_name in fallbacks:
-                try:
-                    model = genai.GenerativeModel(model_name)
-                    resp = model.generate_content(prompt)
-                    last_err = None
-                    break
-                except Exception as _e:
-                    last_err = _e
-                    continue
-            if last_err:
-                raise last_err
-            text = getattr(resp, "text", None) or getattr(resp, "candidates", None)
-            if isinstance(text, list):
-                text = "\n".join(str(x) for x in text)
-            if not isinstance(text, str):
-                text = str(resp)
-            data = self._extract_json(text)
+            tail = f"Title: {title}\nTask: {task}"
+            prompt = PREFIXES["document"] + tail
+            cache = self._llm_cache()
+            # Semantic matches only among earlier document requests with the same, real title
+            scope = f"document\0{title}" if title != DEFAULT_TITLE else None
+            cached = cache.get(primary, prompt, scope=scope, text=task) if cache else None
+            if cached is not None:
+                return cached
+            data = self._generate_with_fallbacks(genai, "document", fallbacks, primary, prompt, tail)
             if not isinstance(data, dict):
                 return None
             # normalize
             title_out = data.get("title") or title
             sections = data.get("sections") if isinstance(data.get("sections"), list) else []
-            return {"title": title_out, "sections": sections}
+            spec = {"title": title_out, "sections": sections}
+            if cache:
+                cache.put(primary, prompt, spec, scope=scope, text=task)
+            return spec
         except Exception as e:  # pragma: no cover
             self.logger.warning("Gemini document generation failed: %s", e)
             return None
 
-    @staticmethod
-    def _extract_json(text: str) -> Optional[dict]:
-        try:
-            return json.loads(text)
-        except Exception:
-            pass
-        m = re.search(r"\{[\s\S]*\}", text)
-        if m:
-            try:
-                return json.loads(m.group(0))
-            except Exception:
-                return None
-        return None
-
     @staticmethod
     def _extract_title(task: str) -> Optional[str]:
-        m = re.search(r"(?:about|on)\s+(.+)$", str(task), re.IGNORECASE)
-        return m.group(1).strip().rstrip(".") if m else None
+        raw = extract_title_after(str(task))
+        return raw.strip().rstrip(".") if raw is not None else None
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
 import os
-import re
 from typing import List, Optional
 
+from ..core.gemini_cache import PREFIXES
+from ..core.gemini_client import DEFAULT_MODEL, get_fallbacks, get_genai
+from ..utils.fast_extract import extract_first_int, extract_title_after
 from .base_agent import BaseOfficeAgent
 
+DEFAULT_TITLE = "Generated Presentation"
+
 
 class PresentationAgent(BaseOfficeAgent):
     """PowerPoint-focused agent that composes a presentation.
@@ -27,29 +30,40 @@ class PresentationAgent(BaseOfficeAgent):
         return "Create clear, minimal slides with a short title and a single main point per slide."
 
     def execute(self, task, context=None, user_id=None, task_id=None):
-        title = (context or {}).get("title") or self._extract_title(task) or "Generated Presentation"
+        title = (context or {}).get("title") or self._extract_title(task) or DEFAULT_TITLE
         n = self._extract_int(task) or 3
-        create = self._tool("create_presentation")
-        add_slide = self._tool("add_slide")
-        save = self._tool("save_presentation")
+        create = self._t_create_presentation
+        add_slide = self._t_add_slide
+        save = self._t_save_presentation
 
         # Try Gemini first
         slides_spec = self._generate_slides_with_gemini(task=str(task), n=n, title=title)
 
         pid = create(title=title)["presentation_id"]
+        texts = []
         if slides_spec:
+            _str = str
             for slide in slides_spec[:n]:
-                stitle = str(slide.get("title") or title)
                 bullets = slide.get("bullets") or []
                 if not isinstance(bullets, list):
-                    bullets = [str(bullets)]
-                text = stitle + "\n" + "\n".join(f"- {str(b)}" for b in bullets)
-                add_slide(presentation_id=pid, text=text)
+                    bullets = [bullets]
+                # title line + one "- bullet" line each, joined once
+                parts = [_str(slide.get("title") or title)]
+                parts.extend("- " + _str(b) for b in bullets)
+                texts.append("\n".join(parts))
         else:
             # Fallback deterministic content
-            for i in range(1, n + 1):
-                add_slide(presentation_id=pid, text=f"{title} — Slide {i}")
-        return save(presentation_id=pid)
+            texts = [f"{title} — Slide {i}" for i in range(1, n + 1)]
+        # add_slide is order-dependent (not thread-safe), so this batch runs serially
+        errors = self._run_tool_batch(
+            add_slide,
+            [{"presentation_id": pid, "text": t} for t in texts],
+            progress=lambda i, _: {"event": "slide_added", "index": i + 1},
+        )
+        result = save(presentation_id=pid)
+        if errors:
+            result["errors"] = errors
+        return result
 
     # --------------------- Gemini draft generation ---------------------
     def _generate_slides_with_gemini(self, task: str, n: int, title: str) -> Optional[List[dict]]:
@@ -57,48 +71,18 @@ class PresentationAgent(BaseOfficeAgent):
         if not api_key:
             return None
         try:
-            import google.generativeai as genai  # type: ignore
-
-            genai.configure(api_key=api_key)
-            primary = os.getenv("LLM_MODEL", "gemini-1.5-pro")
-            # Try a robust fallback list prioritizing the requested model
-            candidates = [primary,
-                          "gemini-2.5-flash",
-                          "gemini-2.0-flash",
-                          "gemini-1.5-flash",
-                          "gemini-1.5-pro"]
-            # de-duplicate while preserving order
-            seen = set()
-            fallbacks = []
-            for m in candidates:
-                if m not in seen:
-                    seen.add(m)
-                    fallbacks.append(m)
-            prompt = (
-                "You are a presentation assistant. Create an outline with up to "
-                f"{int(n)} slides for a presentation titled '{title}'.\n"
-                "Return ONLY valid JSON with this schema and no extra text:\n"
-                "{\n  \"slides\": [\n    { \"title\": \"Slide title\", \"bullets\": [\"point 1\", \"point 2\"] },\n    ...\n  ]\n}\n"
-                f"Task: {task}"
-            )
-            last_err = None
-            for model_name in fallbacks:
-                try:
-                    model = genai.GenerativeModel(model_name)
-                    resp = model.generate_content(prompt)
-                    last_err = None
-                    break
-                except Exception as _e:
-                    last_err = _e
-                    continue
-            if last_err:
-                raise last_err
-            text = getattr(resp, "text", None) or getattr(resp, "candidates", None)
-            if isinstance(text, list):
-                text = "\n".join(str(x) for x in text)
-            if not isinstance(text, str):
-                text = str(resp)
-            data = self._extract_json(text)
+            genai = get_genai(api_key)
+            primary = os.getenv("LLM_MODEL") or DEFAULT_MODEL
+            fallbacks = get_fallbacks(primary)
+            tail = f"Title: {title}\nN: {int(n)}\nTask: {task}"
+            prompt = PREFIXES["slides"] + tail
+            cache = self._llm_cache()
+            # Semantic matches only among earlier slides requests with the same, real title
+            scope = f"slides\0{title}" if title != DEFAULT_TITLE else None
+            cached = cache.get(primary, prompt, scope=scope, text=task) if cache else None
+            if cached is not None:
+                return cached
+            data = self._generate_with_fallbacks(genai, "slides", fallbacks, primary, prompt, tail)
             if not isinstance(data, dict):
                 return None
             slides = data.get("slides")
@@ -113,36 +97,19 @@ class PresentationAgent(BaseOfficeAgent):
                     "title": s.get("title") or title,
                     "bullets": s.get("bullets") if isinstance(s.get("bullets"), list) else [],
                 })
+            if cleaned and cache:
+                cache.put(primary, prompt, cleaned, scope=scope, text=task)
             return cleaned or None
         except Exception as e:  # pragma: no cover - external dependency variability
             self.logger.warning("Gemini slide generation failed: %s", e)
             return None
 
-    @staticmethod
-    def _extract_json(text: str) -> Optional[dict]:
-        # Try direct load
-        try:
-            return json.loads(text)
-        except Exception:
-            pass
-        # Try to find first JSON object
-        m = re.search(r"\{[\s\S]*\}", text)
-        if m:
-            try:
-                return json.loads(m.group(0))
-            except Exception:
-                return None
-        return None
-
     # -------------------------- Utilities -----------------------------
     @staticmethod
     def _extract_int(s: str):
-        m = re.search(r"(\d+)", str(s))
-        return int(m.group(1)) if m else None
+        return extract_first_int(str(s))
 
     @staticmethod
     def _extract_title(task: str):
-        import re as _re
-
-        m = _re.search(r"(?:about|on)\s+(.+)$", str(task), _re.IGNORECASE)
-        return m.group(1).strip().rstrip(".") if m else None
+        raw = extract_title_after(str(task))
+        return raw.strip().rstrip(".") if raw is not None else None
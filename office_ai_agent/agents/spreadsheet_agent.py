@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
 import os
-import re
 from typing import Any, Dict, List, Optional
 
+from ..core.gemini_cache import PREFIXES
+from ..core.gemini_client import DEFAULT_MODEL, get_fallbacks, get_genai
+from ..utils.fast_extract import extract_title_after
 from .base_agent import BaseOfficeAgent
 
+DEFAULT_TITLE = "Generated Sheet"
+
 
 class SpreadsheetAgent(BaseOfficeAgent):
     """Excel-focused agent that writes a simple 2x2 table."""
@@ -15,6 +18,7 @@ class SpreadsheetAgent(BaseOfficeAgent):
         return [
             "create_workbook",
             "write_cell",
+            "write_cells_bulk",
             "save_workbook",
         ]
 
@@ -22,10 +26,9 @@ class SpreadsheetAgent(BaseOfficeAgent):
         return "Create simple, readable spreadsheets with headers and minimal rows."
 
     def execute(self, task, context=None, user_id=None, task_id=None):
-        title = (context or {}).get("title") or self._extract_title(str(task)) or "Generated Sheet"
-        create = self._tool("create_workbook")
-        write = self._tool("write_cell")
-        save = self._tool("save_workbook")
+        title = (context or {}).get("title") or self._extract_title(str(task)) or DEFAULT_TITLE
+        create = self._t_create_workbook
+        save = self._t_save_workbook
 
         spec = self._generate_table_with_gemini(task=str(task), title=title)
 
@@ -33,22 +36,34 @@ class SpreadsheetAgent(BaseOfficeAgent):
         if spec:
             headers = spec.get("headers") if isinstance(spec.get("headers"), list) else []
             rows = spec.get("rows") if isinstance(spec.get("rows"), list) else []
-            # write headers
-            for c, h in enumerate(headers, start=1):
-                write(workbook_id=wb, row=1, col=c, value=str(h))
-            # write rows
+            # headers first, then rows
+            cells = [(1, c, str(h)) for c, h in enumerate(headers, start=1)]
             for r_idx, row in enumerate(rows, start=2):
                 if not isinstance(row, list):
                     row = [row]
-                for c_idx, val in enumerate(row, start=1):
-                    write(workbook_id=wb, row=r_idx, col=c_idx, value=str(val))
+                cells.extend((r_idx, c_idx, str(val)) for c_idx, val in enumerate(row, start=1))
         else:
             # deterministic fallback
-            write(workbook_id=wb, row=1, col=1, value="Item")
-            write(workbook_id=wb, row=1, col=2, value="Value")
-            write(workbook_id=wb, row=2, col=1, value="Example")
-            write(workbook_id=wb, row=2, col=2, value=1)
-        return save(workbook_id=wb)
+            cells = [(1, 1, "Item"), (1, 2, "Value"), (2, 1, "Example"), (2, 2, 1)]
+
+        bulk = self._tool_map.get("write_cells_bulk")
+        if bulk is not None:
+            errors = self._run_tool_batch(bulk, [{"workbook_id": wb, "cells": cells}])
+            # One call wrote every cell; report them individually to a streaming consumer
+            if not errors and self._streaming():
+                for r, c, _ in cells:
+                    self._emit({"event": "cell_written", "row": r, "col": c})
+        else:
+            write = self._t_write_cell
+            errors = self._run_tool_batch(
+                write,
+                [{"workbook_id": wb, "row": r, "col": c, "value": v} for r, c, v in cells],
+                progress=lambda _, kw: {"event": "cell_written", "row": kw["row"], "col": kw["col"]},
+            )
+        result = save(workbook_id=wb)
+        if errors:
+            result["errors"] = errors
+        return result
 
     # --------------------- Gemini draft generation ---------------------
     def _generate_table_with_gemini(self, task: str, title: str) -> Optional[Dict[str, Any]]:
@@ -56,66 +71,32 @@ class SpreadsheetAgent(BaseOfficeAgent):
         if not api_key:
             return None
         try:
-            import google.generativeai as genai  # type: ignore
-
-            genai.configure(api_key=api_key)
-            primary = os.getenv("LLM_MODEL", "gemini-1.5-pro")
-            candidates = [primary, "gemini-2.5-flash", "gemini-2.0-flash", "gemini-1.5-flash", "gemini-1.5-pro"]
-            seen, fallbacks = set(), []
-            for m in candidates:
-                if m not in seen:
-                    seen.add(m)
-                    fallbacks.append(m)
+            genai = get_genai(api_key)
+            primary = os.getenv("LLM_MODEL") or DEFAULT_MODEL
+            fallbacks = get_fallbacks(primary)
 
-            prompt = (
-                "You are a data assistant. Create a compact table suitable for a spreadsheet titled '"
-                + title
-                + "'. Return ONLY valid JSON with this schema and no extra text:\n"
-                "{\n  \"headers\": [\"Header1\", \"Header2\"],\n  \"rows\": [ [\"r1c1\", \"r1c2\"], [\"r2c1\", \"r2c2\"] ]\n}\n"
-                f"Task: {task}"
-            )
-            last_err = None
-            for model_name in fallbacks:
-                try:
-                    model = genai.GenerativeModel(model_name)
-                    resp = model.generate_content(prompt)
-                    last_err = None
-                    break
-                except Exception as _e:
-                    last_err = _e
-                    continue
-            if last_err:
-                raise last_err
-            text = getattr(resp, "text", None) or getattr(resp, "candidates", None)
-            if isinstance(text, list):
-                text = "\n".join(str(x) for x in text)
-            if not isinstance(text, str):
-                text = str(resp)
-            data = self._extract_json(text)
+            tail = f"Title: {title}\nTask: {task}"
+            prompt = PREFIXES["table"] + tail
+            cache = self._llm_cache()
+            # Semantic matches only among earlier table requests with the same, real title
+            scope = f"table\0{title}" if title != DEFAULT_TITLE else None
+            cached = cache.get(primary, prompt, scope=scope, text=task) if cache else None
+            if cached is not None:
+                return cached
+            data = self._generate_with_fallbacks(genai, "table", fallbacks, primary, prompt, tail)
             if not isinstance(data, dict):
                 return None
             headers = data.get("headers") if isinstance(data.get("headers"), list) else []
             rows = data.get("rows") if isinstance(data.get("rows"), list) else []
-            return {"headers": headers, "rows": rows}
+            spec = {"headers": headers, "rows": rows}
+            if cache:
+                cache.put(primary, prompt, spec, scope=scope, text=task)
+            return spec
         except Exception as e:  # pragma: no cover
             self.logger.warning("Gemini table generation failed: %s", e)
             return None
 
-    @staticmethod
-    def _extract_json(text: str) -> Optional[dict]:
-        try:
-            return json.loads(text)
-        except Exception:
-            pass
-        m = re.search(r"\{[\s\S]*\}", text)
-        if m:
-            try:
-                return json.loads(m.group(0))
-            except Exception:
-                return None
-        return None
-
     @staticmethod
     def _extract_title(task: str) -> Optional[str]:
-        m = re.search(r"(?:about|on)\s+(.+)$", str(task), re.IGNORECASE)
-        return m.group(1).strip().rstrip(".") if m else None
+        raw = extract_title_after(str(task))
+        return raw.strip().rstrip(".") if raw is not None else None
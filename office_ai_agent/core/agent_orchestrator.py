@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import re
+import itertools
+import threading
 import time
-from datetime import datetime
+from base64 import b32encode
 from typing import Dict, Iterable, Optional
 
-from ..tools.office_tools import OfficeToolRegistry
+from ..tools.office_tools import get_registry
+from ..utils.fast_extract import extract_first_int, extract_title_after
 from ..utils.logger import get_logger
 from ..utils.metrics import Metrics
 from ..agents.document_agent import DocumentAgent
@@ -14,6 +16,67 @@ from ..agents.spreadsheet_agent import SpreadsheetAgent
 from ..agents.communication_agent import CommunicationAgent
 from ..agents.workflow_agent import WorkflowAgent
 
+try:  # optional multi-pattern matcher for keyword routing
+    import hyperscan  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    hyperscan = None
+
+# Disambiguates task ids created within one clock tick (coarse clocks on Windows)
+_TASK_SEQ = itertools.count()
+
+# Routing keywords; earlier routes win when a task matches several
+_ROUTE_KEYWORDS = (
+    ("presentation", ("slide", "presentation", "ppt")),
+    ("spreadsheet", ("sheet", "spreadsheet", "excel", "table")),
+)
+
+
+def _build_route_db():
+    if hyperscan is None:
+        return None
+    exprs, ids = [], []
+    for route_id, (_, keywords) in enumerate(_ROUTE_KEYWORDS):
+        for k in keywords:
+            exprs.append(k.encode("ascii"))
+            ids.append(route_id)
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=exprs,
+            ids=ids,
+            elements=len(exprs),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(exprs),
+        )
+        return db
+    except Exception:  # pragma: no cover - defensive
+        return None
+
+
+_ROUTE_DB = _build_route_db()
+_ROUTE_DB_LOCK = threading.Lock()  # a Database owns one scratch space; scans must not overlap
+
+
+def _route_task(task: str) -> str:
+    """Return the agent name for `task` based on keywords ('document' if none match)."""
+    if _ROUTE_DB is not None:
+        hits = []
+
+        def on_match(route_id, start, end, flags, context):
+            hits.append(route_id)
+            return route_id == 0  # highest-priority route found; stop scanning
+
+        with _ROUTE_DB_LOCK:
+            try:
+                _ROUTE_DB.scan(task.encode("utf-8"), match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                pass
+        return _ROUTE_KEYWORDS[min(hits)][0] if hits else "document"
+    t = task.lower()
+    for name, keywords in _ROUTE_KEYWORDS:
+        if any(k in t for k in keywords):
+            return name
+    return "document"
+
 
 class OfficeAIAgent:
     """Core orchestrator (Step 5 minimal implementation).
@@ -27,7 +90,7 @@ class OfficeAIAgent:
         self.config = config
         self.logger = get_logger(self.__class__.__name__)
         self.metrics = Metrics()
-        self.tools = OfficeToolRegistry()
+        self.tools = get_registry()
         self._llm = None  # lazy init for Gemini
         self.agents = self._initialize_agents()
 
@@ -68,14 +131,21 @@ class OfficeAIAgent:
         tid = task_id or self._make_task_id()
         yield {"event": "start", "task_id": tid}
         yield {"event": "planning", "message": "Selecting plan based on task keywords"}
-        result = self._run_minimal_plan(task, context or {})
-        yield {"event": "result", "result": result}
+        ctx = context or {}
+        agent_name = (ctx.get("agent") or "").strip().lower()
+        if agent_name not in self.agents:
+            agent_name = _route_task(task)
+        # Relay the agent's progress (e.g. llm_chunk, slide_added) and result; start/end are our own
+        for event in self.agents[agent_name].execute_streaming(task, context=ctx, user_id=user_id, task_id=tid):
+            if event.get("event") not in ("start", "end"):
+                yield event
         yield {"event": "end", "status": "completed"}
 
     # --------------------------- Internal impl ---------------------------
     def _make_task_id(self) -> str:
-        now = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        return f"task_{now}"
+        # 8-byte ns timestamp + 2-byte sequence = 10 bytes -> 16 base32 chars, no padding
+        raw = time.time_ns().to_bytes(8, "big") + (next(_TASK_SEQ) & 0xFFFF).to_bytes(2, "big")
+        return "task_" + b32encode(raw).decode("ascii")
 
     def _init_llm(self):  # pragma: no cover - optional until we use it
         if self._llm is not None:
@@ -101,27 +171,19 @@ class OfficeAIAgent:
         - elif 'sheet' or 'spreadsheet' or 'excel' in task -> create a simple workbook
         - else -> create a simple document
         """
-        t = task.lower()
-        if any(k in t for k in ("slide", "presentation", "ppt")):
-            # Delegate to PresentationAgent so it can use Gemini when available
-            return self.agents["presentation"].execute(task, context=context)
-        if any(k in t for k in ("sheet", "spreadsheet", "excel", "table")):
-            # Delegate to SpreadsheetAgent to allow Gemini-driven table generation
-            return self.agents["spreadsheet"].execute(task, context=context)
-        # Default to DocumentAgent
-        return self.agents["document"].execute(task, context=context)
+        # Presentation/spreadsheet agents can use Gemini when available; DocumentAgent is the default
+        return self.agents[_route_task(task)].execute(task, context=context)
 
     @staticmethod
     def _extract_int(s: str) -> Optional[int]:
-        m = re.search(r"(\d+)", s)
-        return int(m.group(1)) if m else None
+        return extract_first_int(s)
 
     @staticmethod
     def _extract_title(task: str) -> Optional[str]:
         # naive extraction after 'about' or 'on'
-        m = re.search(r"(?:about|on)\s+(.+)$", task, re.IGNORECASE)
-        if m:
-            return m.group(1).strip().rstrip(".")
+        raw = extract_title_after(task)
+        if raw is not None:
+            return raw.strip().rstrip(".")
         return None
 
     # --------------------------- Tool helpers ----------------------------
@@ -164,9 +226,9 @@ class OfficeAIAgent:
     # --------------------------- Agents init ------------------------------
     def _initialize_agents(self):
         return {
-            "document": DocumentAgent(self.tools, name="DocumentAgent"),
-            "presentation": PresentationAgent(self.tools, name="PresentationAgent"),
-            "spreadsheet": SpreadsheetAgent(self.tools, name="SpreadsheetAgent"),
-            "communication": CommunicationAgent(self.tools, name="CommunicationAgent"),
-            "workflow": WorkflowAgent(self.tools, name="WorkflowAgent"),
+            "document": DocumentAgent(self.tools, name="DocumentAgent", config=self.config),
+            "presentation": PresentationAgent(self.tools, name="PresentationAgent", config=self.config),
+            "spreadsheet": SpreadsheetAgent(self.tools, name="SpreadsheetAgent", config=self.config),
+            "communication": CommunicationAgent(self.tools, name="CommunicationAgent", config=self.config),
+            "workflow": WorkflowAgent(self.tools, name="WorkflowAgent", config=self.config),
         }
@@ -1,29 +1,46 @@
 from __future__ import annotations
 
+import copy
 import json
 import os
-from dataclasses import asdict, dataclass, field
+import stat
+import threading
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+try:  # optional, faster JSON encode/decode
+    import orjson as _orjson  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None
+
+
+_TRUE_VALS = frozenset({"1", "true", "yes", "on", "y", "t"})
+_FALSE_VALS = frozenset({"0", "false", "no", "off", "n", "f", ""})
 
 
 def _parse_bool(val: Optional[str], default: bool = False) -> bool:
     if val is None:
         return default
-    return str(val).strip().lower() in {"1", "true", "yes", "on"}
+    s = str(val).strip().lower()
+    if s in _TRUE_VALS:
+        return True
+    if s in _FALSE_VALS:
+        return False
+    return default
 
 
 def _parse_int(val: Optional[str], default: int) -> int:
     try:
         return int(val) if val is not None else default
-    except Exception:
+    except (TypeError, ValueError):
         return default
 
 
 def _parse_float(val: Optional[str], default: float) -> float:
     try:
         return float(val) if val is not None else default
-    except Exception:
+    except (TypeError, ValueError):
         return default
 
 
@@ -33,6 +50,8 @@ class LLMConfig:
     model: str = "gemini-1.5-pro"
     temperature: float = 0.7
     gemini_api_key: Optional[str] = None
+    cache_ttl_seconds: int = 7 * 24 * 3600  # LLM response cache; 0 disables
+    hedge_stagger_ms: int = 2000  # wait for a first streamed chunk before the next fallback launches
 
 
 @dataclass
@@ -61,6 +80,35 @@ class MonitoringConfig:
 class AppFlags:
     debug: bool = False
     development: bool = True
+    parallel_tools: bool = False  # run batches of thread-safe tool calls on a thread pool
+
+
+def _field_names(cls: type) -> FrozenSet[str]:
+    return frozenset(f.name for f in fields(cls))
+
+
+# JSON section -> (Config attribute, accepted keys, value coercer)
+_SECTIONS: Dict[str, Tuple[str, FrozenSet[str], Optional[Callable[[Any], Any]]]] = {
+    "llm": ("llm", _field_names(LLMConfig), None),
+    "features": ("features", _field_names(FeatureToggles), bool),
+    "server": ("server", _field_names(ServerConfig), None),
+    "monitoring": ("monitoring", _field_names(MonitoringConfig), None),
+    "flags": ("flags", _field_names(AppFlags), bool),
+}
+
+
+# Environment variables read by Config.load; part of the load cache key
+_ENV_VARS = (
+    "LLM_PROVIDER", "LLM_MODEL", "LLM_TEMPERATURE", "GEMINI_API_KEY", "LLM_CACHE_TTL", "LLM_HEDGE_STAGGER_MS",
+    "ENABLE_POWERPOINT", "ENABLE_WORD", "ENABLE_EXCEL", "ENABLE_OUTLOOK", "ENABLE_TEAMS",
+    "API_PORT", "WEB_PORT", "LOG_LEVEL", "SENTRY_DSN", "LOG_FILE",
+    "DEBUG", "DEVELOPMENT", "PARALLEL_TOOLS",
+)
+
+_LOAD_LOCK = threading.Lock()
+_dotenv_loaded = False
+# (cache key, loaded Config) for the most recent Config.load()
+_cached_load: Optional[Tuple[Tuple[Any, ...], "Config"]] = None
 
 
 @dataclass
@@ -74,6 +122,10 @@ class Config:
     # ----------------------------- Load/Save ------------------------------
     @staticmethod
     def _load_dotenv_if_available() -> None:
+        global _dotenv_loaded
+        if _dotenv_loaded:  # once per process; load_dotenv never overrides set vars anyway
+            return
+        _dotenv_loaded = True
         try:  # optional
             from dotenv import load_dotenv  # type: ignore
 
@@ -82,40 +134,37 @@ class Config:
             pass
 
     @staticmethod
-    def _find_config_file() -> Optional[Path]:
+    def _config_file_state() -> Tuple[Optional[Path], Optional[int]]:
+        """Return `(path, mtime_ns)` of the first existing config file, one stat() per candidate."""
         candidates = [
             Path.cwd() / "config.json",
             Path.cwd() / "office_ai_agent.json",
             Path.home() / ".office_ai_agent" / "config.json",
         ]
         for p in candidates:
-            if p.exists() and p.is_file():
-                return p
-        return None
+            try:
+                st = os.stat(p)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
+                return p, st.st_mtime_ns
+        return None, None
+
+    @staticmethod
+    def _find_config_file() -> Optional[Path]:
+        return Config._config_file_state()[0]
 
     @staticmethod
     def _apply_dict(cfg: "Config", data: Dict[str, Any]) -> None:
         # Shallow update for nested dataclasses if matching keys exist
-        if "llm" in data and isinstance(data["llm"], dict):
-            for k, v in data["llm"].items():
-                if hasattr(cfg.llm, k):
-                    setattr(cfg.llm, k, v)
-        if "features" in data and isinstance(data["features"], dict):
-            for k, v in data["features"].items():
-                if hasattr(cfg.features, k):
-                    setattr(cfg.features, k, bool(v))
-        if "server" in data and isinstance(data["server"], dict):
-            for k, v in data["server"].items():
-                if hasattr(cfg.server, k):
-                    setattr(cfg.server, k, v)
-        if "monitoring" in data and isinstance(data["monitoring"], dict):
-            for k, v in data["monitoring"].items():
-                if hasattr(cfg.monitoring, k):
-                    setattr(cfg.monitoring, k, v)
-        if "flags" in data and isinstance(data["flags"], dict):
-            for k, v in data["flags"].items():
-                if hasattr(cfg.flags, k):
-                    setattr(cfg.flags, k, bool(v))
+        for section, (attr, allowed, coerce) in _SECTIONS.items():
+            sub = data.get(section)
+            if not isinstance(sub, dict):
+                continue
+            target = getattr(cfg, attr)
+            for k, v in sub.items():
+                if k in allowed:
+                    setattr(target, k, coerce(v) if coerce else v)
 
     @classmethod
     def load(cls, strict: bool = False) -> "Config":
@@ -124,15 +173,32 @@ class Config:
         Precedence (lowest to highest): defaults < JSON file < env vars.
         If `strict` and provider is gemini, require GEMINI_API_KEY.
         """
+        global _cached_load
         cls._load_dotenv_if_available()
 
+        # Reuse the previous result while the config file and relevant env vars are unchanged
+        cfg_file, mtime_ns = cls._config_file_state()
+        key = (cls, cfg_file, mtime_ns, tuple(os.environ.get(k) for k in _ENV_VARS))
+        with _LOAD_LOCK:
+            if _cached_load is not None and _cached_load[0] == key:
+                cfg = copy.deepcopy(_cached_load[1])
+            else:
+                cfg = cls._load_uncached(cfg_file)
+                _cached_load = (key, copy.deepcopy(cfg))
+
+        if strict:
+            cfg.validate()
+        return cfg
+
+    @classmethod
+    def _load_uncached(cls, cfg_file: Optional[Path]) -> "Config":
         cfg = cls()
 
         # JSON config (optional)
-        cfg_file = cls._find_config_file()
         if cfg_file is not None:
             try:
-                data = json.loads(cfg_file.read_text(encoding="utf-8"))
+                raw = cfg_file.read_bytes()
+                data = _orjson.loads(raw) if _orjson is not None else json.loads(raw.decode("utf-8"))
                 if isinstance(data, dict):
                     cls._apply_dict(cfg, data)
             except Exception:
@@ -149,6 +215,8 @@ class Config:
         gemini_key = os.getenv("GEMINI_API_KEY")
         if gemini_key:
             cfg.llm.gemini_api_key = gemini_key
+        cfg.llm.cache_ttl_seconds = _parse_int(os.getenv("LLM_CACHE_TTL"), cfg.llm.cache_ttl_seconds)
+        cfg.llm.hedge_stagger_ms = _parse_int(os.getenv("LLM_HEDGE_STAGGER_MS"), cfg.llm.hedge_stagger_ms)
 
         cfg.features.enable_powerpoint = _parse_bool(os.getenv("ENABLE_POWERPOINT"), cfg.features.enable_powerpoint)
         cfg.features.enable_word = _parse_bool(os.getenv("ENABLE_WORD"), cfg.features.enable_word)
@@ -172,9 +240,7 @@ class Config:
 
         cfg.flags.debug = _parse_bool(os.getenv("DEBUG"), cfg.flags.debug)
         cfg.flags.development = _parse_bool(os.getenv("DEVELOPMENT"), cfg.flags.development)
-
-        if strict:
-            cfg.validate()
+        cfg.flags.parallel_tools = _parse_bool(os.getenv("PARALLEL_TOOLS"), cfg.flags.parallel_tools)
         return cfg
 
     def validate(self) -> None:
@@ -183,12 +249,18 @@ class Config:
 
     # ----------------------------- Utilities ------------------------------
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Sections are flat dataclasses, so a shallow copy of each __dict__ is
+        # equivalent to dataclasses.asdict without its recursive deep copy.
+        return {f.name: dict(vars(getattr(self, f.name))) for f in fields(self)}
 
     def save_config(self, path: Optional[os.PathLike] | Optional[str] = None) -> Path:
         if path is None:
             path = Path.cwd() / "config.json"
         p = Path(path)
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        if _orjson is not None:
+            # orjson serializes (nested) dataclasses natively; no intermediate dicts
+            p.write_bytes(_orjson.dumps(self, option=_orjson.OPT_INDENT_2))
+        else:
+            p.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
         return p
@@ -0,0 +1,122 @@
+"""Gemini explicit context caching for the static instruction prefixes.
+
+Each agent prompt is a static instruction/schema prefix followed by a short
+variable tail (title, count, task). When a prefix is long enough for Gemini to
+accept as cached content, it is uploaded once per process, API key and model via
+``genai.caching.CachedContent`` and later calls reference it, sending only the
+tail. Shorter prefixes (the current ones) are never padded to the minimum token
+count: the primary model would then see a differently biased prompt from the
+fallbacks, so they are sent inline like on every other path without caching
+(old SDK, unsupported model, API error).
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils.logger import get_logger
+from .gemini_client import configured_key, get_model
+
+CACHE_TTL = _dt.timedelta(hours=1)
+MIN_CACHE_TOKENS = 2048
+_CHARS_PER_TOKEN = 4  # conservative estimate for English text
+_REFRESH_MARGIN_SECONDS = 60
+_RETRY_SECONDS = 300  # after a failed create, use the inline prefix for this long
+
+logger = get_logger("GeminiPrefixCache")
+
+
+PREFIXES: Dict[str, str] = {
+    "slides": (
+        "You are a presentation assistant. Create an outline with up to N slides "
+        "for the presentation titled Title, both given below.\n"
+        "Return ONLY valid JSON with this schema and no extra text:\n"
+        "{\n  \"slides\": [\n    { \"title\": \"Slide title\", \"bullets\": [\"point 1\", \"point 2\"] },\n    ...\n  ]\n}\n"
+    ),
+    "table": (
+        "You are a data assistant. Create a compact table suitable for a spreadsheet "
+        "titled Title, given below.\n"
+        "Return ONLY valid JSON with this schema and no extra text:\n"
+        "{\n  \"headers\": [\"Header1\", \"Header2\"],\n  \"rows\": [ [\"r1c1\", \"r1c2\"], [\"r2c1\", \"r2c2\"] ]\n}\n"
+    ),
+    "document": (
+        "You are a writing assistant. Draft a short, clear document titled Title, given below.\n"
+        "Return ONLY valid JSON with this schema and no extra text:\n"
+        "{\n  \"title\": \"Document Title\",\n  \"sections\": [\n    { \"heading\": \"Section Heading\", \"paragraphs\": [\"para1\", \"para2\"] },\n    ...\n  ]\n}\n"
+    ),
+}
+
+def cached_prefix(kind: str) -> Optional[str]:
+    """Return the prefix to cache for `kind`, or None when it is below MIN_CACHE_TOKENS."""
+    prefix = PREFIXES[kind]
+    return prefix if len(prefix) >= MIN_CACHE_TOKENS * _CHARS_PER_TOKEN else None
+
+
+class GeminiPrefixCache:
+    """Process-wide registry of Gemini cached-content names per (API key, kind, model)."""
+
+    _lock = threading.Lock()
+    # (api key, kind, model) -> (cached_content name or None on failure, expires_at)
+    _entries: Dict[Tuple[Optional[str], str, str], Tuple[Optional[str], float]] = {}
+    # Keys whose CachedContent.create is running; other callers wait on the event
+    _inflight: Dict[Tuple[Optional[str], str, str], threading.Event] = {}
+
+    @classmethod
+    def get_name(cls, genai: Any, kind: str, model_name: str) -> Optional[str]:
+        """Return the cached-content name for `kind` on `model_name`, creating it lazily.
+
+        Caches belong to the project of the API key that created them, so entries
+        are keyed by the configured key as well.
+        """
+        contents = cached_prefix(kind)
+        if contents is None:
+            return None
+        key = (configured_key(), kind, model_name)
+        while True:
+            with cls._lock:
+                entry = cls._entries.get(key)
+                if entry is not None and time.time() < entry[1]:
+                    return entry[0]
+                pending = cls._inflight.get(key)
+                if pending is None:
+                    done = cls._inflight[key] = threading.Event()
+                    break
+            pending.wait()
+
+        # The network call runs outside the lock, so other keys are not blocked
+        name: Optional[str] = None
+        expires_at = time.time() + _RETRY_SECONDS
+        try:
+            cc = genai.caching.CachedContent.create(
+                model=model_name,
+                contents=[contents],
+                ttl=CACHE_TTL,
+            )
+            name = cc.name
+            expires_at = time.time() + CACHE_TTL.total_seconds() - _REFRESH_MARGIN_SECONDS
+        except Exception as e:  # pragma: no cover - depends on SDK/API availability
+            logger.info("Gemini context cache unavailable for %s/%s: %s", kind, model_name, e)
+        finally:
+            with cls._lock:
+                cls._entries[key] = (name, expires_at)
+                del cls._inflight[key]
+            done.set()
+        return name
+
+
+def gemini_model(genai: Any, kind: str, model_name: str, primary: str) -> Tuple[Any, bool]:
+    """Return `(GenerativeModel, uses_cached_prefix)` for a fallback candidate.
+
+    Only the primary model gets a cached prefix; fallbacks use the inline prompt.
+    """
+    if model_name == primary:
+        name = GeminiPrefixCache.get_name(genai, kind, model_name)
+        if name:
+            try:
+                return get_model(model_name, name), True
+            except Exception as e:  # pragma: no cover - SDK variability
+                logger.info("Could not bind cached content %s: %s", name, e)
+    return get_model(model_name), False
@@ -0,0 +1,65 @@
+"""Process-wide access to the `google.generativeai` SDK.
+
+The SDK (an optional dependency) is imported once, on first use, and
+`genai.configure` runs only when the API key changes, instead of on every agent
+call.
+"""
+
+from __future__ import annotations
+
+import threading
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+DEFAULT_MODEL = "gemini-1.5-pro"
+# Tried after the requested model, in order
+FALLBACK_MODELS = ("gemini-2.5-flash", "gemini-2.0-flash", "gemini-1.5-flash", "gemini-1.5-pro")
+
+_lock = threading.Lock()
+_genai: Any = None
+_configured_key: Optional[str] = None
+
+
+def get_genai(api_key: str) -> Any:
+    """Return the `google.generativeai` module configured for `api_key`.
+
+    Raises ImportError if the SDK is not installed.
+    """
+    global _genai, _configured_key
+    if _genai is not None and api_key == _configured_key:
+        return _genai
+    with _lock:
+        if _genai is None:
+            import google.generativeai as genai  # type: ignore
+
+            _genai = genai
+        if api_key != _configured_key:
+            _genai.configure(api_key=api_key)
+            _configured_key = api_key
+            # Models bind the SDK client on first use; drop ones built for the old key
+            get_model.cache_clear()
+        return _genai
+
+
+def configured_key() -> Optional[str]:
+    """Return the API key the SDK is currently configured with, if any."""
+    return _configured_key
+
+
+@lru_cache(maxsize=4)
+def get_fallbacks(primary: Optional[str]) -> Tuple[str, ...]:
+    """Return the de-duplicated model list, the requested model first."""
+    return tuple(dict.fromkeys((primary or DEFAULT_MODEL, *FALLBACK_MODELS)))
+
+
+@lru_cache(maxsize=16)
+def get_model(model_name: str, cached_content_name: Optional[str] = None) -> Any:
+    """Return a reusable `GenerativeModel`, bound to cached content when given.
+
+    Requires `get_genai` to have been called first.
+    """
+    if _genai is None:
+        raise RuntimeError("get_genai() must be called before get_model()")
+    if cached_content_name:
+        return _genai.GenerativeModel.from_cached_content(cached_content=cached_content_name)
+    return _genai.GenerativeModel(model_name)
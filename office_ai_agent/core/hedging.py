@@ -0,0 +1,71 @@
+"""Hedged (staggered, concurrent) execution of redundant calls.
+
+`first_success` starts the first call immediately and launches the next one when
+either `stagger_seconds` pass without any sign of progress or an in-flight call
+fails. Progress is reported through the optional `started` event (agents set it
+on the first streamed chunk), so a model that is already streaming is never
+raced by a more expensive hedge; at most `max_in_flight` calls run at once. The
+first successful result wins. Calls that have not started are cancelled; calls
+already running are not waited for and their results are discarded. Stopping them
+is up to the caller: agents set an event once this returns, which their streaming
+attempts check between chunks.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional, Sequence, Set, TypeVar
+
+T = TypeVar("T")
+
+
+def first_success(
+    calls: Sequence[Callable[[], T]],
+    stagger_seconds: float,
+    started: Optional[threading.Event] = None,
+    max_in_flight: int = 2,
+) -> T:
+    """Return the result of the first call in `calls` that succeeds.
+
+    Timeout-triggered hedges stop once `started` is set. Raises the last error if
+    every call fails.
+    """
+    if not calls:
+        raise ValueError("no calls to run")
+    if len(calls) == 1:
+        return calls[0]()
+
+    cap = max(1, max_in_flight)
+    ex = ThreadPoolExecutor(max_workers=min(cap, len(calls)), thread_name_prefix="hedge")
+    try:
+        pending: Set[Future] = {ex.submit(calls[0])}
+        nxt = 1
+        last_err: Optional[BaseException] = None
+        while pending or nxt < len(calls):
+            can_hedge = nxt < len(calls) and len(pending) < cap and not (started is not None and started.is_set())
+            timeout = max(0.0, stagger_seconds) if can_hedge else None
+            if pending:
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            else:
+                done = set()
+            for f in done:
+                err = f.exception()
+                if err is None:
+                    return f.result()
+                last_err = err
+            if done:
+                # Replace each failed call, within the in-flight cap
+                launch = min(len(done), len(calls) - nxt, cap - len(pending))
+            elif not pending or (started is None or not started.is_set()):
+                # Stagger elapsed with no progress (or nothing left running): add one hedge
+                launch = min(1, len(calls) - nxt, cap - len(pending))
+            else:
+                launch = 0
+            for _ in range(launch):
+                pending.add(ex.submit(calls[nxt]))
+                nxt += 1
+        assert last_err is not None
+        raise last_err
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,208 @@
+"""Two-tier response cache for LLM calls.
+
+Exact tier: SHA-256 of ``model + "\\0" + normalized prompt`` stored in SQLite (WAL
+mode) under ``~/.office_ai_agent/llm_cache``. Semantic tier (opt-in per call):
+hashed bag-of-words vectors of the caller's variable `text` (the user's task, never
+the fixed instruction prefix, which would dominate the vector) compared by cosine
+similarity, only against entries with the same model and `scope`. Agents scope by
+output kind and a title taken from the task (never the default one), so rephrasings
+of one request can share an answer while a different topic never does. Short tasks
+differing in one word still score above any useful threshold, so a semantic hit
+also requires the same content words (every token outside a small stopword list,
+numbers included): "sales" never serves "expenses", nor "3 slides" a "5 slides"
+request. The vector then only ranks rephrasings that differ in filler words,
+order or repetition.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+SIMILARITY_THRESHOLD = 0.92
+DEFAULT_CACHE_DIR = Path.home() / ".office_ai_agent" / "llm_cache"
+
+_DIM = 4096
+_WORD_RE = re.compile(r"\w+")
+# Filler and instruction words that do not change what is being asked for
+_STOPWORDS = frozenset(
+    "a an the of for to in on at about with and or by from into as per "
+    "i me my we us our you your their its it this that these those is are be "
+    "please kindly can could would will some up new "
+    "create make write generate build draft prepare produce give".split()
+)
+
+# (key, terms, vector, created)
+_IndexEntry = Tuple[str, str, Dict[int, float], float]
+
+
+def _normalize(prompt: str) -> str:
+    return " ".join(str(prompt).split())
+
+
+def _normalize_scope(scope: Optional[str]) -> str:
+    return _normalize(scope).lower() if scope else ""
+
+
+def _terms(text: str) -> str:
+    """Sorted, de-duplicated content words of `text`."""
+    return " ".join(sorted({t for t in _WORD_RE.findall(text.lower()) if t not in _STOPWORDS}))
+
+
+def _embed(text: str) -> Dict[int, float]:
+    """Hashed term-frequency vector (sparse, L2-normalized)."""
+    vec: Dict[int, float] = {}
+    for tok in _WORD_RE.findall(text.lower()):
+        # crc32 is stable across processes, unlike hash()
+        idx = zlib.crc32(tok.encode("utf-8")) % _DIM
+        vec[idx] = vec.get(idx, 0.0) + 1.0
+    norm = math.sqrt(sum(v * v for v in vec.values()))
+    if norm:
+        for k in vec:
+            vec[k] /= norm
+    return vec
+
+
+def _cosine(a: Dict[int, float], b: Dict[int, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(k, 0.0) for k, v in a.items())
+
+
+class LLMCache:
+    """Exact + semantic cache of parsed LLM responses keyed on (model, prompt).
+
+    The semantic tier is used only when `scope` and `text` are passed to get/put.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        threshold: float = SIMILARITY_THRESHOLD,
+    ) -> None:
+        self.ttl_seconds = int(ttl_seconds)
+        self.threshold = float(threshold)
+        self.logger = get_logger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        # (model, scope) -> semantic index entries, loaded lazily from SQLite
+        self._index: Dict[Tuple[str, str], List[_IndexEntry]] = {}
+
+        base = Path(path) if path is not None else DEFAULT_CACHE_DIR
+        base.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(base / "cache.sqlite3"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, model TEXT NOT NULL, scope TEXT NOT NULL, terms TEXT NOT NULL,"
+            " vector TEXT NOT NULL, value TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_scope ON responses(model, scope)")
+        self._conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl_seconds,))
+        self._conn.commit()
+
+    # ------------------------------ Public API ------------------------------
+    def get(self, model: str, prompt: str, *, scope: Optional[str] = None, text: Optional[str] = None) -> Optional[Any]:
+        """Return the cached value for `prompt`, or None on a miss.
+
+        With `scope` and `text`, a miss on the exact prompt falls back to the most
+        similar `text` with the same content words under the same model and scope.
+        """
+        norm = _normalize(prompt)
+        key = self._key(model, norm)
+        cutoff = time.time() - self.ttl_seconds
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM responses WHERE key = ? AND created >= ?", (key, cutoff)
+                ).fetchone()
+                if row is None and scope and text:
+                    row = self._semantic_lookup(model, _normalize_scope(scope), _normalize(text), cutoff)
+            return json.loads(row[0]) if row is not None else None
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning("LLM cache lookup failed: %s", e)
+            return None
+
+    def put(self, model: str, prompt: str, value: Any, *, scope: Optional[str] = None, text: Optional[str] = None) -> None:
+        """Store a JSON-serializable `value` for `prompt` (and `text` within `scope`)."""
+        norm = _normalize(prompt)
+        key = self._key(model, norm)
+        scope_n = _normalize_scope(scope) if text else ""
+        text_n = _normalize(text) if scope_n else ""
+        terms = _terms(text_n)
+        vec = _embed(text_n) if scope_n else {}
+        now = time.time()
+        try:
+            payload = json.dumps(value, ensure_ascii=False)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, scope, terms, vector, value, created)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, model, scope_n, terms, json.dumps(vec), payload, now),
+                )
+                self._conn.commit()
+                idx_key = (model, scope_n)
+                if scope_n and idx_key in self._index:
+                    entries = [e for e in self._index[idx_key] if e[0] != key]
+                    entries.append((key, terms, vec, now))
+                    self._index[idx_key] = entries
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.warning("LLM cache store failed: %s", e)
+
+    # ------------------------------ Internals -------------------------------
+    @staticmethod
+    def _key(model: str, norm_prompt: str) -> str:
+        return hashlib.sha256(f"{model}\0{norm_prompt}".encode("utf-8")).hexdigest()
+
+    def _load_index(self, model: str, scope: str) -> List[_IndexEntry]:
+        idx_key = (model, scope)
+        entries = self._index.get(idx_key)
+        if entries is None:
+            rows = self._conn.execute(
+                "SELECT key, terms, vector, created FROM responses WHERE model = ? AND scope = ?", (model, scope)
+            ).fetchall()
+            entries = [
+                (k, t, {int(i): w for i, w in json.loads(v).items()}, created) for k, t, v, created in rows
+            ]
+            self._index[idx_key] = entries
+        return entries
+
+    def _semantic_lookup(self, model: str, scope: str, text: str, cutoff: float) -> Optional[Tuple[str]]:
+        terms = _terms(text)
+        vec = _embed(text)
+        best_key, best_sim = None, self.threshold
+        for key, other_terms, other, created in self._load_index(model, scope):
+            if created < cutoff or other_terms != terms:
+                continue
+            sim = _cosine(vec, other)
+            if sim >= best_sim:
+                best_key, best_sim = key, sim
+        if best_key is None:
+            return None
+        return self._conn.execute("SELECT value FROM responses WHERE key = ?", (best_key,)).fetchone()
+
+
+@lru_cache(maxsize=None)
+def get_llm_cache(ttl_seconds: int = DEFAULT_TTL_SECONDS) -> Optional[LLMCache]:
+    """Return the process-wide cache for the default location.
+
+    Returns None (logged once; the result is memoized) when the cache cannot be
+    opened, e.g. an unwritable home directory, so generation runs uncached.
+    """
+    try:
+        return LLMCache(ttl_seconds=ttl_seconds)
+    except (OSError, sqlite3.Error) as e:
+        get_logger("LLMCache").warning("LLM cache disabled, cannot open %s: %s", DEFAULT_CACHE_DIR, e)
+        return None
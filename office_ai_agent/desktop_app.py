@@ -19,8 +19,10 @@ class DesktopApp(tk.Tk):
         self.minsize(700, 480)
 
         self._agent = OfficeAIAgent(Config.load())
-        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._queue: "queue.SimpleQueue[Dict[str, Any]]" = queue.SimpleQueue()
         self._worker: Optional[threading.Thread] = None
+        # Workers wake the UI via _notify(); this slow poll is only a safety net
+        self._poll_ms = 500
 
         self._build_ui()
         self._poll_queue()
@@ -96,6 +98,7 @@ class DesktopApp(tk.Tk):
                 self._queue.put({"type": "result", "data": result})
             except Exception as e:  # pragma: no cover - UI safety
                 self._queue.put({"type": "error", "data": str(e)})
+            self._notify()
 
         self._worker = threading.Thread(target=worker, daemon=True)
         self._worker.start()
@@ -124,10 +127,17 @@ class DesktopApp(tk.Tk):
     def _set_status(self, text: str) -> None:
         self.status_var.set(text)
 
-    def _poll_queue(self) -> None:
+    def _notify(self) -> None:
+        # Called from worker threads: schedule a drain on the Tk loop right away
+        try:
+            self.after(0, self._drain_queue)
+        except (RuntimeError, tk.TclError):  # pragma: no cover - loop not running; poll catches it
+            pass
+
+    def _drain_queue(self) -> None:
         try:
             while True:
-                msg = self._queue.get_nowait()
+                msg = self._queue.get(block=False)
                 if msg["type"] == "result":
                     data = msg["data"]
                     self._append_output(f"Result: {data}\n")
@@ -139,8 +149,12 @@ class DesktopApp(tk.Tk):
                     self.run_btn.config(state=tk.NORMAL)
         except queue.Empty:
             pass
+
+    def _poll_queue(self) -> None:
+        try:
+            self._drain_queue()
         finally:
-            self.after(150, self._poll_queue)
+            self.after(self._poll_ms, self._poll_queue)
 
 
 def main() -> None:
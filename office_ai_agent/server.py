@@ -2,25 +2,78 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
+from collections import OrderedDict
 from typing import Any, AsyncGenerator, Dict, Optional
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from .core.agent_orchestrator import OfficeAIAgent
+try:  # optional, faster JSON encoding for every response and SSE frame
+    import orjson  # type: ignore
+    from fastapi.responses import ORJSONResponse as _JSONResponse
+
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - depends on environment
+    _JSONResponse = JSONResponse
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+try:  # optional: SSE response with keep-alive pings
+    from sse_starlette.sse import EventSourceResponse  # type: ignore
+except ImportError:  # pragma: no cover - depends on environment
+    EventSourceResponse = None
+
 from .core.config import Config
 from .utils.logger import get_logger
 
 
 # --------------------------- App and Orchestrator ---------------------------
-config = Config.load()
 logger = get_logger("server")
-agent = OfficeAIAgent(config=config)
-_TASKS: Dict[str, Dict[str, Any]] = {}
+# Recent task results for /status, least recently used first
+_TASKS: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_MAX_TASKS = 10_000
+_SENTINEL = object()
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+_SSE_PING_SECONDS = 15  # keeps idle proxies from closing long agent runs
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+# Frames are coalesced into one write per 4 KiB or 20 ms, whichever comes first
+_SSE_BATCH_BYTES = 4096
+_SSE_BATCH_SECONDS = 0.02
+_SSE_QUEUE_SIZE = 64
+
+app = FastAPI(title="Office AI Agent API", version="0.1.0", default_response_class=_JSONResponse)
+
+
+_AGENT: Any = None
+_AGENT_LOCK = threading.Lock()
+
+
+def _agent():
+    """Return the orchestrator, building it (and its agents) on first use, not at import.
+
+    Blocking: call it off the event loop (see `_agent_async`). The lock makes racing
+    first calls from threadpool and SSE producer threads share one build.
+    """
+    global _AGENT
+    if _AGENT is None:
+        with _AGENT_LOCK:
+            if _AGENT is None:
+                from .core.agent_orchestrator import OfficeAIAgent
+
+                _AGENT = OfficeAIAgent(config=Config.load())
+    return _AGENT
+
+
+async def _agent_async():
+    # Already built: no threadpool hop
+    return _AGENT if _AGENT is not None else await run_in_threadpool(_agent)
 
-app = FastAPI(title="Office AI Agent API", version="0.1.0")
 
 # CORS for local frontend/dev (aligns with docs)
 app.add_middleware(
@@ -37,7 +90,7 @@ app.add_middleware(
 
 # ------------------------------ Models (light) ------------------------------
 def _ok(data: Dict[str, Any]) -> JSONResponse:
-    return JSONResponse(content=data)
+    return _JSONResponse(content=data)
 
 
 class ExecuteRequest(BaseModel):
@@ -47,60 +100,156 @@ class ExecuteRequest(BaseModel):
     task_id: Optional[str] = None
 
 
+def _remember(task_id: str, data: Dict[str, Any]) -> None:
+    # Only touched from the event loop, so no lock is needed
+    _TASKS[task_id] = data
+    _TASKS.move_to_end(task_id)
+    while len(_TASKS) > _MAX_TASKS:
+        _TASKS.popitem(last=False)
+
+
 # ------------------------------- Endpoints ---------------------------------
+# Trivial endpoints are async so they run on the event loop without a threadpool hop
 @app.get("/health")
-def health() -> Dict[str, str]:
+async def health() -> Dict[str, str]:
     return {"status": "ok"}
 
 
 @app.get("/agents")
-def list_agents() -> Dict[str, Any]:
-    return {"agents": sorted(list(agent.agents.keys()))}
+async def list_agents() -> Dict[str, Any]:
+    return {"agents": sorted(list((await _agent_async()).agents.keys()))}
 
 
 @app.post("/execute")
 async def execute(req: ExecuteRequest) -> JSONResponse:
     logger.info("/execute task_id=%s", req.task_id or "<auto>")
-    result = agent.execute(
+    # The agent blocks (building it, tools, LLM calls); keep it off the event loop
+    result = await run_in_threadpool(
+        _execute,
         task=req.task,
         context=req.context or {},
         user_id=req.user_id,
         task_id=req.task_id,
     )
     if isinstance(result, dict) and result.get("task_id"):
-        _TASKS[result["task_id"]] = result
+        _remember(result["task_id"], result)
     return _ok(result)
 
 
-def _to_sse(event: Dict[str, Any]) -> str:
-    # Format as Server-Sent Events line
-    return f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+def _execute(**kwargs: Any) -> Dict[str, Any]:
+    # Resolves the orchestrator on the worker thread, not the event loop
+    return _agent().execute(**kwargs)
+
+
+def _to_sse(event: Dict[str, Any]) -> bytes:
+    # One SSE frame, built directly as bytes
+    return _SSE_PREFIX + _dumps(event) + _SSE_SUFFIX
+
+
+def _produce_frames(
+    task: str,
+    user_id: Optional[str],
+    loop: asyncio.AbstractEventLoop,
+    q: "asyncio.Queue[Any]",
+    slots: threading.Semaphore,
+    stop: threading.Event,
+) -> None:
+    # Runs on its own thread: drives the blocking agent generator, encodes frames and
+    # hands them to the event loop. `slots` bounds frames in flight (backpressure)
+    events = None
+    try:
+        events = _agent().execute_streaming(task=task, context={}, user_id=user_id)
+        for event in events:
+            slots.acquire()
+            if stop.is_set():
+                return
+            loop.call_soon_threadsafe(q.put_nowait, _to_sse(event))
+    except Exception:
+        logger.exception("/execute_stream producer failed")
+    finally:
+        if events is not None:
+            events.close()
+        if not stop.is_set():
+            try:
+                loop.call_soon_threadsafe(q.put_nowait, _SENTINEL)
+            except RuntimeError:  # pragma: no cover - loop already closed
+                pass
+
+
+async def _sse_batches(task: str, user_id: Optional[str]) -> AsyncGenerator[bytes, None]:
+    """Yield SSE frames coalesced into chunks of up to _SSE_BATCH_BYTES.
+
+    The agent runs on a producer thread that feeds an asyncio.Queue, so a stalled
+    agent never blocks the event loop. A chunk is written once it is full or
+    _SSE_BATCH_SECONDS after its first frame; queued frames are drained without waiting.
+    """
+    loop = asyncio.get_running_loop()
+    q: "asyncio.Queue[Any]" = asyncio.Queue()  # bounded by `slots`, not maxsize
+    slots = threading.Semaphore(_SSE_QUEUE_SIZE)
+    stop = threading.Event()
+    threading.Thread(
+        target=_produce_frames, args=(task, user_id, loop, q, slots, stop), name="sse-producer", daemon=True
+    ).start()
+    getter: Optional[asyncio.Future] = None
+    buf = bytearray()
+    deadline = 0.0
+    finished = False
+    try:
+        while not finished:
+            if getter is None:
+                getter = asyncio.ensure_future(q.get())
+            # The pending get survives a timeout, so no frame is lost between windows
+            done, _ = await asyncio.wait({getter}, timeout=max(0.0, deadline - loop.time()) if buf else None)
+            if not done:
+                yield bytes(buf)
+                buf.clear()
+                continue
+            frame, getter = getter.result(), None
+            while True:
+                if frame is _SENTINEL:
+                    finished = True
+                    break
+                slots.release()
+                if not buf:
+                    deadline = loop.time() + _SSE_BATCH_SECONDS
+                buf += frame
+                if len(buf) >= _SSE_BATCH_BYTES or q.empty():
+                    break
+                frame = q.get_nowait()
+            if buf and (finished or len(buf) >= _SSE_BATCH_BYTES):
+                yield bytes(buf)
+                buf.clear()
+    finally:
+        if getter is not None:
+            getter.cancel()
+        # Client gone or stream done: let a blocked producer wake up and exit
+        stop.set()
+        slots.release(_SSE_QUEUE_SIZE)
 
 
 @app.get("/execute_stream")
-async def execute_stream(task: str, user_id: Optional[str] = None) -> StreamingResponse:
+async def execute_stream(task: str, user_id: Optional[str] = None) -> Response:
     logger.info("/execute_stream task='%s'", task)
-
-    async def gen() -> AsyncGenerator[bytes, None]:
-        # Use the synchronous generator from orchestrator in a thread-friendly loop
-        loop = agent.execute_streaming(task=task, context={}, user_id=user_id)
-        for event in loop:
-            yield _to_sse(event).encode("utf-8")
-            # slight pause to avoid flooding the client
-            await asyncio.sleep(0.01)
-
-    return StreamingResponse(gen(), media_type="text/event-stream")
+    if EventSourceResponse is not None:
+        # sse-starlette passes pre-framed bytes through unchanged and adds its pings
+        return EventSourceResponse(_sse_batches(task, user_id), ping=_SSE_PING_SECONDS, headers=_SSE_HEADERS)
+    return StreamingResponse(_sse_batches(task, user_id), media_type="text/event-stream", headers=_SSE_HEADERS)
 
 
 @app.get("/metrics")
-def metrics() -> Dict[str, Any]:
-    return {"metrics": agent.metrics.snapshot()}
+async def metrics() -> Response:
+    # snapshot() is plain str/int/float; encode it in one call and skip FastAPI's
+    # jsonable_encoder walk over the nested dict
+    agent = await _agent_async()
+    return Response(content=_dumps({"metrics": agent.metrics.snapshot()}), media_type="application/json")
 
 
 @app.get("/status/{task_id}")
-def status(task_id: str) -> Dict[str, Any]:
-    if task_id in _TASKS:
-        return _TASKS[task_id]
+async def status(task_id: str) -> Dict[str, Any]:
+    data = _TASKS.get(task_id)
+    if data is not None:
+        _TASKS.move_to_end(task_id)
+        return data
     raise HTTPException(status_code=404, detail="task_id not found")
 
 
@@ -109,6 +258,7 @@ def run(host: str = "127.0.0.1", port: Optional[int] = None) -> None:
     """Launch the FastAPI server with Uvicorn."""
     import uvicorn
 
+    config = Config.load()
     p = port or (config.server.api_port if config and config.server else 8765)
     logger.info("Starting API server on %s:%s", host, p)
     uvicorn.run(app, host=host, port=p, log_level=(config.monitoring.log_level.lower() if config and config.monitoring else "info"))
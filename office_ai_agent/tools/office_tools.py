@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from . import simple_tools as st
 
@@ -11,6 +12,8 @@ class Tool:
     name: str
     description: str
     func: Callable[..., dict]
+    # Safe to invoke concurrently from several threads (order-independent, no shared mutable state)
+    thread_safe: bool = False
 
     def __call__(self, *args, **kwargs) -> dict:  # pragma: no cover - thin wrapper
         return self.func(*args, **kwargs)
@@ -20,13 +23,11 @@ class OfficeToolRegistry:
     """Registry for tools used by agents and orchestrator."""
 
     def __init__(self) -> None:
-        self._tools: List[Tool] = []
         self._tool_map: Dict[str, Tool] = {}
         self._register_simple_tools()
 
-    def _register(self, name: str, func: Callable[..., dict], description: str) -> None:
-        t = Tool(name=name, description=description, func=func)
-        self._tools.append(t)
+    def _register(self, name: str, func: Callable[..., dict], description: str, thread_safe: bool = False) -> None:
+        t = Tool(name=name, description=description, func=func, thread_safe=thread_safe)
         self._tool_map[name] = t
 
     def _register_simple_tools(self) -> None:
@@ -45,15 +46,26 @@ class OfficeToolRegistry:
         # Spreadsheets
         self._register("create_workbook", st.create_workbook, "Create a new spreadsheet session.")
         self._register("write_cell", st.write_cell, "Write a cell value using 1-based row/col indexing.")
+        self._register("write_cells_bulk", st.write_cells_bulk, "Write many (row, col, value) cells in one call.")
         self._register("save_workbook", st.save_workbook, "Save a composed workbook to XLSX or TXT.")
 
         # FS helpers
-        self._register("list_files", st.list_files, "List files in a workspace subfolder.")
-        self._register("get_file_info", st.get_file_info, "Get information about a specific file.")
+        self._register("list_files", st.list_files, "List files in a workspace subfolder.", thread_safe=True)
+        self._register("get_file_info", st.get_file_info, "Get information about a specific file.", thread_safe=True)
         self._register("create_folder", st.create_folder, "Create a folder under a workspace subfolder.")
 
     def get_all_tools(self) -> List[Tool]:
-        return list(self._tools)
+        return list(self._tool_map.values())
 
     def get_tool(self, name: str) -> Optional[Tool]:
         return self._tool_map.get(name)
+
+    def get_tools(self, names: Iterable[str]) -> Dict[str, Tool]:
+        """Return the registered tools among `names`; unknown names are skipped."""
+        return {n: t for n in names if (t := self._tool_map.get(n)) is not None}
+
+
+@lru_cache(maxsize=1)
+def get_registry() -> OfficeToolRegistry:
+    """Return the process-wide registry; tools are stateless wrappers, so one is enough."""
+    return OfficeToolRegistry()
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Dict, Optional
 
-from ..utils.file_manager import FileManager
+from ..utils.file_manager import get_file_manager
 
 
 def get_available_agents() -> dict:
@@ -51,7 +51,7 @@ def delegate_to_agent(agent_type: str, task: str, context: Optional[dict] = None
 
 	This is a stand-in for true delegation to specialized agents.
 	"""
-	fm = FileManager()
+	fm = get_file_manager()
 	title = f"{agent_type or 'agent'}_task"
 	content = f"Task: {task}\nContext: {context or {}}\n"
 	return fm.save_text_document(title, content)
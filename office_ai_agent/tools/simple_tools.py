@@ -7,33 +7,46 @@ LangChain tools without changing their core behavior.
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from ..utils.file_manager import FileManager
+from ..utils.file_manager import FileManager, get_file_manager
+
+
+def _claim_id(base: str, sessions: Dict[str, object], counters: Dict[str, int], sess: object) -> str:
+	"""Store `sess` under `base`, or `base_<n>` with a free suffix, and return the id used.
+
+	Each candidate is claimed with one `setdefault`, which is atomic, so concurrent
+	callers never share an id. `counters` remembers the next suffix to try per base,
+	so repeated collisions do not rescan from 1.
+	"""
+	if sessions.setdefault(base, sess) is sess:
+		counters.pop(base, None)
+		return base
+	i = counters.get(base, 1)
+	while sessions.setdefault(f"{base}_{i}", sess) is not sess:
+		i += 1
+	counters[base] = i + 1
+	return f"{base}_{i}"
 
 
 # -------------------------- Document composition ---------------------------
 
-@dataclass
+@dataclass(slots=True)
 class _DocumentSession:
 	title: str
 	paragraphs: List[str] = field(default_factory=list)
 
 
 _DOC_SESSIONS: Dict[str, _DocumentSession] = {}
+_DOC_COUNTERS: Dict[str, int] = {}
 
 
 def create_document(title: str) -> dict:
-	doc_id = FileManager._slugify(title)  # reuse slug for id
-	if doc_id in _DOC_SESSIONS:
-		# create a unique id by suffixing
-		i = 1
-		while f"{doc_id}_{i}" in _DOC_SESSIONS:
-			i += 1
-		doc_id = f"{doc_id}_{i}"
-	_DOC_SESSIONS[doc_id] = _DocumentSession(title=title)
+	# reuse slug for id, suffixed when taken
+	doc_id = _claim_id(FileManager._slugify(title), _DOC_SESSIONS, _DOC_COUNTERS, _DocumentSession(title=title))
 	return {"status": "ok", "doc_id": doc_id}
 
 
@@ -58,29 +71,24 @@ def save_document(doc_id: str) -> dict:
 	sess = _DOC_SESSIONS.pop(doc_id, None)
 	if not sess:
 		return {"status": "error", "error": f"unknown doc_id: {doc_id}"}
-	fm = FileManager()
+	fm = get_file_manager()
 	return fm.save_docx_document(sess.title, sess.paragraphs or [sess.title, "(empty)"])
 
 
 # ----------------------- Presentation composition -------------------------
 
-@dataclass
+@dataclass(slots=True)
 class _PresentationSession:
 	title: str
 	slides: List[str] = field(default_factory=list)
 
 
 _PRES_SESSIONS: Dict[str, _PresentationSession] = {}
+_PRES_COUNTERS: Dict[str, int] = {}
 
 
 def create_presentation(title: str) -> dict:
-	pres_id = FileManager._slugify(title)
-	if pres_id in _PRES_SESSIONS:
-		i = 1
-		while f"{pres_id}_{i}" in _PRES_SESSIONS:
-			i += 1
-		pres_id = f"{pres_id}_{i}"
-	_PRES_SESSIONS[pres_id] = _PresentationSession(title=title)
+	pres_id = _claim_id(FileManager._slugify(title), _PRES_SESSIONS, _PRES_COUNTERS, _PresentationSession(title=title))
 	return {"status": "ok", "presentation_id": pres_id}
 
 
@@ -108,33 +116,39 @@ def save_presentation(presentation_id: str) -> dict:
 	sess = _PRES_SESSIONS.pop(presentation_id, None)
 	if not sess:
 		return {"status": "error", "error": f"unknown presentation_id: {presentation_id}"}
-	fm = FileManager()
+	fm = get_file_manager()
 	slides = sess.slides or ["(empty)"]
 	return fm.save_pptx_presentation(sess.title, slides)
 
 
 # -------------------------- Spreadsheet composition -----------------------
 
-@dataclass
+@dataclass(slots=True)
 class _WorkbookSession:
 	title: str
 	rows: List[List[object]] = field(default_factory=list)
 
 
 _WB_SESSIONS: Dict[str, _WorkbookSession] = {}
+_WB_COUNTERS: Dict[str, int] = {}
 
 
 def create_workbook(title: str) -> dict:
-	wb_id = FileManager._slugify(title)
-	if wb_id in _WB_SESSIONS:
-		i = 1
-		while f"{wb_id}_{i}" in _WB_SESSIONS:
-			i += 1
-		wb_id = f"{wb_id}_{i}"
-	_WB_SESSIONS[wb_id] = _WorkbookSession(title=title)
+	wb_id = _claim_id(FileManager._slugify(title), _WB_SESSIONS, _WB_COUNTERS, _WorkbookSession(title=title))
 	return {"status": "ok", "workbook_id": wb_id}
 
 
+def _set_cell(sess: _WorkbookSession, r: int, c: int, value: object) -> None:
+	# expand rows structure in one resize each (a generator, so rows are distinct lists)
+	rows = sess.rows
+	if len(rows) < r:
+		rows.extend([] for _ in range(r - len(rows)))
+	row = rows[r - 1]
+	if len(row) < c:
+		row.extend([""] * (c - len(row)))
+	row[c - 1] = value
+
+
 def write_cell(workbook_id: str, row: int, col: int, value: object) -> dict:
 	sess = _WB_SESSIONS.get(workbook_id)
 	if not sess:
@@ -143,43 +157,74 @@ def write_cell(workbook_id: str, row: int, col: int, value: object) -> dict:
 	c = int(col)
 	if r < 1 or c < 1:
 		return {"status": "error", "error": "row and col must be >= 1"}
-	# expand rows structure
-	while len(sess.rows) < r:
-		sess.rows.append([])
-	while len(sess.rows[r - 1]) < c:
-		sess.rows[r - 1].append("")
-	sess.rows[r - 1][c - 1] = value
+	_set_cell(sess, r, c, value)
 	return {"status": "ok", "workbook_id": workbook_id}
 
 
+def write_cells_bulk(workbook_id: str, cells: Iterable[Tuple[int, int, object]]) -> dict:
+	"""Write many `(row, col, value)` cells (1-based) in a single call."""
+	sess = _WB_SESSIONS.get(workbook_id)
+	if not sess:
+		return {"status": "error", "error": f"unknown workbook_id: {workbook_id}"}
+	parsed = [(int(r), int(c), v) for r, c, v in cells]
+	if any(r < 1 or c < 1 for r, c, _ in parsed):
+		return {"status": "error", "error": "row and col must be >= 1"}
+	for r, c, v in parsed:
+		_set_cell(sess, r, c, v)
+	return {"status": "ok", "workbook_id": workbook_id, "written": len(parsed)}
+
+
 def save_workbook(workbook_id: str) -> dict:
 	sess = _WB_SESSIONS.pop(workbook_id, None)
 	if not sess:
 		return {"status": "error", "error": f"unknown workbook_id: {workbook_id}"}
-	fm = FileManager()
+	fm = get_file_manager()
 	rows = sess.rows or [["(empty)"]]
 	return fm.save_xlsx_workbook(sess.title, rows)
 
 
 # ------------------------------ FS helpers ---------------------------------
 
+# Workspace subfolder per `kind` argument
+_FOLDER_MAP: Dict[str, str] = {
+	"documents": FileManager.DOCUMENTS,
+	"presentations": FileManager.PRESENTATIONS,
+	"spreadsheets": FileManager.SPREADSHEETS,
+	"templates": FileManager.TEMPLATES,
+	"exports": FileManager.EXPORTS,
+}
+
+
+def _walk_files(top: str) -> List[str]:
+	"""Return sorted paths of all files below `top`, like `glob("**/*")` + `is_file()`.
+
+	Uses `os.scandir`, whose entries carry the file type from the directory read, so
+	only symlinks need an extra stat. Symlinked directories are not descended into.
+	"""
+	files: List[str] = []
+	stack = [top]
+	while stack:
+		try:
+			it = os.scandir(stack.pop())
+		except OSError:
+			continue
+		with it:
+			for entry in it:
+				if entry.is_dir(follow_symlinks=False):
+					stack.append(entry.path)
+				elif entry.is_file():
+					files.append(entry.path)
+	files.sort()
+	return files
+
+
 def list_files(kind: str) -> dict:
 	"""List files within a workspace subfolder (documents/presentations/spreadsheets/templates/exports)."""
-	fm = FileManager()
 	kind = str(kind).lower()
-	folder_map = {
-		"documents": fm.DOCUMENTS,
-		"presentations": fm.PRESENTATIONS,
-		"spreadsheets": fm.SPREADSHEETS,
-		"templates": fm.TEMPLATES,
-		"exports": fm.EXPORTS,
-	}
-	sub = folder_map.get(kind)
+	sub = _FOLDER_MAP.get(kind)
 	if not sub:
 		return {"status": "error", "error": f"unknown kind: {kind}"}
-	base = fm.base_dir / sub
-	items = sorted([str(p) for p in base.glob("**/*") if p.is_file()])
-	return {"status": "ok", "files": items}
+	return {"status": "ok", "files": _walk_files(str(get_file_manager().base_dir / sub))}
 
 
 def get_file_info(file_path: str) -> dict:
@@ -196,19 +241,11 @@ def get_file_info(file_path: str) -> dict:
 
 
 def create_folder(kind: str, name: str) -> dict:
-	fm = FileManager()
 	kind = str(kind).lower()
-	folder_map = {
-		"documents": fm.DOCUMENTS,
-		"presentations": fm.PRESENTATIONS,
-		"spreadsheets": fm.SPREADSHEETS,
-		"templates": fm.TEMPLATES,
-		"exports": fm.EXPORTS,
-	}
-	sub = folder_map.get(kind)
+	sub = _FOLDER_MAP.get(kind)
 	if not sub:
 		return {"status": "error", "error": f"unknown kind: {kind}"}
-	target = fm.base_dir / sub / FileManager._slugify(name)
+	target = get_file_manager().base_dir / sub / FileManager._slugify(name)
 	target.mkdir(parents=True, exist_ok=True)
 	return {"status": "ok", "folder_path": str(target)}
 
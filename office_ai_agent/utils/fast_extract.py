@@ -0,0 +1,115 @@
+"""Title / integer extraction used by the agents on every `execute()`.
+
+With ``FAST_EXTRACT_NUMBA=true`` and Numba installed, title extraction on ASCII
+task strings goes through a JIT-compiled, hand-written matcher for
+``(?:about|on)\\s+(.+)$`` instead of the regex engine. Numba is imported and the
+kernel compiled on the first such call, never at import: for the short task
+strings seen here the import and dispatch cost more than the regex saves, so it
+is opt-in. Otherwise, and for non-ASCII input whose Unicode whitespace class
+the kernel does not model, the precompiled regex is used; both paths return
+identical results. Integer extraction always uses the compiled regex: a JIT
+digit scanner measured slower than `re` once call dispatch is included.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from typing import Any, Optional, Tuple
+
+_INT_RE = re.compile(r"(\d+)")
+_TITLE_RE = re.compile(r"(?:about|on)\s+(.+)$", re.IGNORECASE)
+
+_NL = 10
+
+
+def _is_space(c: int) -> bool:
+    # ASCII subset of Python's str `\s` (str.isspace): \t\n\v\f\r, \x1c-\x1f and space
+    return (9 <= c <= 13) or (28 <= c <= 32)
+
+
+def _keyword_len(buf, i: int, n: int) -> int:
+    # Case-insensitive "about" or "on" at i (c | 32 lowercases ASCII letters only)
+    if i + 5 <= n and (buf[i] | 32) == 97 and (buf[i + 1] | 32) == 98 and (buf[i + 2] | 32) == 111 \
+            and (buf[i + 3] | 32) == 117 and (buf[i + 4] | 32) == 116:
+        return 5
+    if i + 2 <= n and (buf[i] | 32) == 111 and (buf[i + 1] | 32) == 110:
+        return 2
+    return 0
+
+
+def _rest_of_line_end(buf, k: int, n: int) -> int:
+    # End of `.+$` starting at k, or -1: needs >= 1 char and only a trailing "\n" after it
+    q = k
+    while q < n and buf[q] != _NL:
+        q += 1
+    if q > k and (q == n or q == n - 1):
+        return q
+    return -1
+
+
+def _title_span_py(buf) -> Tuple[int, int]:
+    n = len(buf)
+    for i in range(n):
+        L = _keyword_len(buf, i, n)
+        if L == 0:
+            continue
+        j = i + L
+        if j >= n or not _is_space(buf[j]):
+            continue
+        w = j + 1
+        while w < n and _is_space(buf[w]):
+            w += 1
+        # \s+ is greedy: try the longest whitespace run first, then give back
+        for k in range(w, j, -1):
+            e = _rest_of_line_end(buf, k, n)
+            if e >= 0:
+                return k, e
+    return -1, -1
+
+
+_kernel_lock = threading.Lock()
+# Compiled title kernel; None until first use, False when disabled or Numba is missing
+_title_span: Any = None
+
+
+def _title_kernel() -> Any:
+    global _title_span, _is_space, _keyword_len, _rest_of_line_end
+    if _title_span is not None:
+        return _title_span
+    with _kernel_lock:
+        if _title_span is None:
+            kernel: Any = False
+            if (os.getenv("FAST_EXTRACT_NUMBA") or "").strip().lower() in ("1", "true", "yes", "on"):
+                try:  # optional JIT
+                    import numba  # type: ignore
+                except ImportError:  # pragma: no cover - depends on environment
+                    pass
+                else:  # pragma: no cover - depends on environment
+                    # Helpers are rebound first: Numba resolves them as globals when compiling
+                    def jit(f: Any) -> Any:
+                        return numba.njit(cache=True)(getattr(f, "py_func", f))
+
+                    _is_space = jit(_is_space)
+                    _keyword_len = jit(_keyword_len)
+                    _rest_of_line_end = jit(_rest_of_line_end)
+                    kernel = jit(_title_span_py)
+            _title_span = kernel
+    return _title_span
+
+
+def extract_first_int(s: str) -> Optional[int]:
+    """Return the first run of digits in `s` as an int, or None."""
+    m = _INT_RE.search(s)
+    return int(m.group(1)) if m else None
+
+
+def extract_title_after(s: str) -> Optional[str]:
+    """Return the text after the first 'about'/'on' + whitespace, like `_TITLE_RE`."""
+    kernel = _title_kernel() if s.isascii() else False
+    if kernel is not False:
+        start, end = kernel(s.encode("ascii"))
+        return s[start:end] if start >= 0 else None
+    m = _TITLE_RE.search(s)
+    return m.group(1) if m else None
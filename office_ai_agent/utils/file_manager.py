@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional
 
@@ -45,7 +46,15 @@ class FileManager:
         (self.base_dir / self.TEMPLATES).mkdir(parents=True, exist_ok=True)
         (self.base_dir / self.EXPORTS).mkdir(parents=True, exist_ok=True)
 
+    def _subdir(self, name: str) -> Path:
+        # Re-ensured per save (one mkdir): the instance is shared, and the folder may
+        # have been deleted since it was created
+        d = self.base_dir / name
+        d.mkdir(parents=True, exist_ok=True)
+        return d
+
     @staticmethod
+    @lru_cache(maxsize=1024)  # titles repeat across create/save calls
     def _slugify(name: str) -> str:
         safe = [c if c.isalnum() or c in ("-", "_", ".", " ") else "_" for c in name.strip()]
         s = "".join(safe).strip().replace(" ", "_")
@@ -68,13 +77,13 @@ class FileManager:
     # ---------- Text fallbacks ----------
     def save_text_document(self, title: str, content: str) -> dict:
         filename = f"{self._slugify(title)}.txt"
-        path = self._unique_path(self.base_dir / self.DOCUMENTS / filename)
+        path = self._unique_path(self._subdir(self.DOCUMENTS) / filename)
         path.write_text(content, encoding="utf-8")
         return {"status": "ok", "file_path": str(path)}
 
     def save_text_presentation(self, title: str, slides: Iterable[str]) -> dict:
         filename = f"{self._slugify(title)}.txt"
-        path = self._unique_path(self.base_dir / self.PRESENTATIONS / filename)
+        path = self._unique_path(self._subdir(self.PRESENTATIONS) / filename)
         lines = []
         for idx, slide in enumerate(slides, start=1):
             lines.append(f"# Slide {idx}")
@@ -85,7 +94,7 @@ class FileManager:
 
     def save_text_spreadsheet(self, title: str, rows: Iterable[Iterable[object]]) -> dict:
         filename = f"{self._slugify(title)}.txt"
-        path = self._unique_path(self.base_dir / self.SPREADSHEETS / filename)
+        path = self._unique_path(self._subdir(self.SPREADSHEETS) / filename)
         lines = []
         for row in rows:
             line = "\t".join("" if v is None else str(v) for v in row)
@@ -101,7 +110,7 @@ class FileManager:
             return self.save_text_document(title, "\n\n".join(paragraphs))
 
         filename = f"{self._slugify(title)}.docx"
-        path = self._unique_path(self.base_dir / self.DOCUMENTS / filename)
+        path = self._unique_path(self._subdir(self.DOCUMENTS) / filename)
         doc = docx.Document()
         # Optional: first paragraph as heading if present
         first = None
@@ -128,7 +137,7 @@ class FileManager:
             return self.save_text_presentation(title, slides)
 
         filename = f"{self._slugify(title)}.pptx"
-        path = self._unique_path(self.base_dir / self.PRESENTATIONS / filename)
+        path = self._unique_path(self._subdir(self.PRESENTATIONS) / filename)
         prs = Presentation()
         layout = prs.slide_layouts[1]  # Title and Content
         for idx, content in enumerate(slides, start=1):
@@ -145,7 +154,7 @@ class FileManager:
             return self.save_text_spreadsheet(title, rows)
 
         filename = f"{self._slugify(title)}.xlsx"
-        path = self._unique_path(self.base_dir / self.SPREADSHEETS / filename)
+        path = self._unique_path(self._subdir(self.SPREADSHEETS) / filename)
         wb = Workbook()
         ws = wb.active
         for row in rows:
@@ -153,3 +162,16 @@ class FileManager:
         wb.save(str(path))
         return {"status": "ok", "file_path": str(path)}
 
+
+@lru_cache(maxsize=8)
+def _file_manager_for(cwd: str) -> FileManager:
+    return FileManager(os.path.join(cwd, "office_ai_files"))
+
+
+def get_file_manager() -> FileManager:
+    """Return the shared FileManager for the current working directory.
+
+    Created (and its directories ensured) once per working directory instead of
+    on every tool call.
+    """
+    return _file_manager_for(os.getcwd())
@@ -0,0 +1,74 @@
+"""Extract a JSON object from free-form LLM output.
+
+Models often wrap the requested JSON in prose or Markdown fences. Instead of a
+greedy ``\\{[\\s\\S]*\\}`` regex, the scanner below walks the text once, jumping
+between structural characters while tracking brace depth, string literals and
+escapes, and parses the first balanced ``{...}`` span.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Optional, Tuple
+
+try:  # optional, faster parser
+    import orjson as _orjson  # type: ignore
+
+    _loads = _orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    _loads = json.loads
+
+_TOKEN_RE = re.compile(r'[{}"\\]')
+
+
+def _first_object_span(text: str) -> Optional[Tuple[int, int]]:
+    """Return `(start, end)` of the first balanced top-level `{...}` in `text`."""
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    skip = -1  # index of a character escaped by a preceding backslash
+    # Jump between structural characters only; everything else cannot change state
+    for m in _TOKEN_RE.finditer(text, start):
+        i = m.start()
+        if i == skip:
+            continue
+        ch = m.group()
+        if in_string:
+            if ch == "\\":
+                skip = i + 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
+
+
+def extract_first_json_object(text: str) -> Optional[dict]:
+    """Parse `text` as a JSON object, or the first balanced object embedded in it."""
+    if not isinstance(text, str):
+        return None
+    stripped = text.lstrip()
+    # Only attempt a direct parse when it can plausibly succeed; skips an exception path
+    if stripped.startswith("{"):
+        try:
+            data = _loads(stripped)
+            return data if isinstance(data, dict) else None
+        except ValueError:
+            pass
+    span = _first_object_span(text)
+    if span is None:
+        return None
+    try:
+        data = _loads(text[span[0]:span[1]])
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
@@ -11,11 +11,16 @@ _LEVEL_MAP = {
     "DEBUG": logging.DEBUG,
 }
 
+_DEFAULT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+# Epoch seconds instead of asctime: skips localtime + strftime per record
+_FAST_FORMAT = "%(created).3f [%(levelname)s] %(name)s: %(message)s"
+
 
 def get_logger(name: str, level: Optional[str] = None, log_file: Optional[str] = None) -> logging.Logger:
     """Return a configured logger.
 
-    Respects LOG_LEVEL environment variable if `level` not provided.
+    Respects LOG_LEVEL environment variable if `level` not provided, and
+    LOG_FAST=1 for epoch timestamps instead of formatted local time.
     Optionally writes to a file in addition to stderr.
     """
     logger = logging.getLogger(name)
@@ -27,7 +32,8 @@ def get_logger(name: str, level: Optional[str] = None, log_file: Optional[str] =
     lvl = _LEVEL_MAP.get(lvl_name, logging.INFO)
 
     logger.setLevel(lvl)
-    fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    fast = (os.getenv("LOG_FAST") or "").strip().lower() in ("1", "true", "yes", "on")
+    fmt = logging.Formatter(_FAST_FORMAT if fast else _DEFAULT_FORMAT)
 
     sh = logging.StreamHandler()
     sh.setFormatter(fmt)
@@ -38,4 +44,6 @@ def get_logger(name: str, level: Optional[str] = None, log_file: Optional[str] =
         fh.setFormatter(fmt)
         logger.addHandler(fh)
 
+    # Our handlers already emit the record; don't format it again via root handlers
+    logger.propagate = False
     return logger
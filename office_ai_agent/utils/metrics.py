@@ -5,37 +5,44 @@ from contextlib import contextmanager
 from typing import Dict
 
 
+class _TimerStat:
+    """Call count and cumulative nanoseconds for one named timer."""
+
+    __slots__ = ("count", "total_ns")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+
+
 class Metrics:
     """Lightweight in-process metrics with counters and simple timers."""
 
     def __init__(self) -> None:
         self.counters: Dict[str, int] = {}
-        # timers[name] = {"count": int, "total": float}
-        self.timers: Dict[str, Dict[str, float | int]] = {}
+        self.timers: Dict[str, _TimerStat] = {}
 
     def inc(self, key: str, value: int = 1) -> None:
         self.counters[key] = int(self.counters.get(key, 0)) + int(value)
 
     @contextmanager
     def timer(self, name: str):
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         try:
             yield
         finally:
-            elapsed = time.perf_counter() - start
-            entry = self.timers.get(name)
-            if entry is None:
-                self.timers[name] = {"count": 1, "total": elapsed}
-            else:
-                entry["count"] = int(entry.get("count", 0)) + 1
-                entry["total"] = float(entry.get("total", 0.0)) + float(elapsed)
+            elapsed = time.perf_counter_ns() - start
+            st = self.timers.get(name) or self.timers.setdefault(name, _TimerStat())
+            st.count += 1
+            st.total_ns += elapsed
 
     def snapshot(self) -> dict:
-        # Provide avg for timers
+        """Return counters and timers as plain dicts of str -> int/float (JSON-ready)."""
+        # Provide avg for timers; seconds are derived from the integer ns total here only
         timers = {}
         for k, v in self.timers.items():
-            count = int(v.get("count", 0))
-            total = float(v.get("total", 0.0))
+            count = v.count
+            total = v.total_ns / 1e9
             avg = (total / count) if count else 0.0
             timers[k] = {"count": count, "total": total, "avg": avg}
         return {"counters": dict(self.counters), "timers": timers}
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from office_ai_agent.agents.presentation_agent import PresentationAgent
+
+
+def test_presentation_streams_slide_events(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    agent = PresentationAgent()
+    events = list(agent.execute_streaming("Create a 3-slide presentation about cats"))
+    names = [e["event"] for e in events]
+    assert names == ["start", "slide_added", "slide_added", "slide_added", "result", "end"]
+    assert [e["index"] for e in events if e["event"] == "slide_added"] == [1, 2, 3]
+    assert Path(events[-2]["result"]["file_path"]).exists()
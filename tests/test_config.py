@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from office_ai_agent.core import config as config_mod
+from office_ai_agent.core.config import Config
+
+
+def _isolate(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    for k in config_mod._ENV_VARS:
+        monkeypatch.delenv(k, raising=False)
+    monkeypatch.setattr(config_mod, "_dotenv_loaded", True)
+    monkeypatch.setattr(config_mod, "_cached_load", None)
+
+
+def test_config_load_reloads_on_env_change(tmp_path: Path, monkeypatch):
+    _isolate(tmp_path, monkeypatch)
+    monkeypatch.setenv("LLM_MODEL", "model-a")
+    assert Config.load().llm.model == "model-a"
+    monkeypatch.setenv("LLM_MODEL", "model-b")
+    assert Config.load().llm.model == "model-b"
+    monkeypatch.setenv("LLM_HEDGE_STAGGER_MS", "750")
+    assert Config.load().llm.hedge_stagger_ms == 750
+
+
+def test_config_load_reloads_on_file_rewrite(tmp_path: Path, monkeypatch):
+    _isolate(tmp_path, monkeypatch)
+    cfg_file = tmp_path / "config.json"
+    cfg_file.write_text(json.dumps({"llm": {"model": "model-a"}}))
+    assert Config.load().llm.model == "model-a"
+
+    mtime_ns = cfg_file.stat().st_mtime_ns
+    cfg_file.write_text(json.dumps({"llm": {"model": "model-b"}}))
+    # Coarse filesystem timestamps could leave the mtime unchanged
+    os.utime(cfg_file, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    assert Config.load().llm.model == "model-b"
+
+
+def test_config_load_returns_independent_copies(tmp_path: Path, monkeypatch):
+    _isolate(tmp_path, monkeypatch)
+    first = Config.load()
+    first.llm.model = "mutated"
+    first.features.enable_teams = True
+    second = Config.load()
+    assert second is not first
+    assert second.llm.model != "mutated"
+    assert second.features.enable_teams is False
+    assert Config.load().llm is not second.llm
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from office_ai_agent.utils import fast_extract as fe
+
+CASES = [
+    "Create a 5 slide presentation about the future of AI.",
+    "Write a report on Q4 sales",
+    "presentation about x",  # 'on' inside a word followed by whitespace
+    "talk ABOUT   spaced title\n",
+    "about \nsecond line",
+    "about    ",
+    "nothing to see here",
+    "on\x1cseparated",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", CASES)
+def test_title_kernel_matches_regex(text: str):
+    m = fe._TITLE_RE.search(text)
+    expected = m.group(1) if m else None
+    start, end = fe._title_span_py(text.encode("ascii"))
+    assert (text[start:end] if start >= 0 else None) == expected
+    assert fe.extract_title_after(text) == expected
+
+
+def test_extract_first_int():
+    assert fe.extract_first_int("Create 12 slides, not 3") == 12
+    assert fe.extract_first_int("no digits") is None
+
+
+def test_numba_is_not_imported_eagerly():
+    code = (
+        "import sys\n"
+        "from office_ai_agent.utils import fast_extract as fe\n"
+        "assert fe.extract_title_after('a talk about cats') == 'cats'\n"
+        "assert 'numba' not in sys.modules\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "FAST_EXTRACT_NUMBA"}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+@pytest.mark.parametrize("text", CASES)
+def test_opt_in_kernel_matches_regex(text: str, monkeypatch):
+    pytest.importorskip("numba")
+    monkeypatch.setenv("FAST_EXTRACT_NUMBA", "1")
+    monkeypatch.setattr(fe, "_title_span", None)
+    m = fe._TITLE_RE.search(text)
+    assert fe.extract_title_after(text) == (m.group(1) if m else None)
+    assert fe._title_span is not False
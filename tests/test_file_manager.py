@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import shutil
 from pathlib import Path
 
 from office_ai_agent.utils.file_manager import FileManager
@@ -18,3 +19,12 @@ def test_file_manager_text_saves(tmp_path: Path):
         p = Path(r["file_path"])
         assert p.exists(), f"Expected file to exist: {p}"
         assert p.suffix == ".txt"
+
+
+def test_file_manager_recreates_deleted_folders(tmp_path: Path):
+    fm = FileManager(base_dir=str(tmp_path / "office_ai_files"))
+    shutil.rmtree(tmp_path / "office_ai_files")
+
+    r = fm.save_text_document("after_cleanup", "Hello again")
+    assert r["status"] == "ok"
+    assert Path(r["file_path"]).exists()
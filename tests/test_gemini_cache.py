@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+from office_ai_agent.core import gemini_cache, gemini_client
+from office_ai_agent.core.gemini_cache import GeminiPrefixCache
+
+
+class _FakeGenai:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.fail = False
+        self.created = []
+        self.caching = SimpleNamespace(CachedContent=SimpleNamespace(create=self._create))
+
+    def _create(self, model, contents, ttl):
+        self.created.append(model)
+        if self.fail:
+            raise RuntimeError("transient")
+        time.sleep(self.delay)
+        return SimpleNamespace(name=f"cachedContents/{model}-{len(self.created)}")
+
+
+def _reset(monkeypatch, key):
+    # The real prefixes are below the minimum and are never cached
+    monkeypatch.setattr(gemini_cache, "MIN_CACHE_TOKENS", 1)
+    monkeypatch.setattr(GeminiPrefixCache, "_entries", {})
+    monkeypatch.setattr(GeminiPrefixCache, "_inflight", {})
+    monkeypatch.setattr(gemini_client, "_configured_key", key)
+
+
+def test_prefix_cache_creates_once_outside_lock(monkeypatch):
+    _reset(monkeypatch, "key-a")
+    genai = _FakeGenai(delay=0.2)
+    names = []
+    threads = [
+        threading.Thread(target=lambda: names.append(GeminiPrefixCache.get_name(genai, "slides", "m")))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    # Another model is not blocked behind the slow create
+    t0 = time.perf_counter()
+    GeminiPrefixCache.get_name(_FakeGenai(), "slides", "other")
+    assert time.perf_counter() - t0 < 0.1
+    for t in threads:
+        t.join()
+    assert genai.created == ["m"]
+    assert len(set(names)) == 1 and names[0] is not None
+
+
+def test_prefix_cache_is_keyed_by_api_key(monkeypatch):
+    _reset(monkeypatch, "key-a")
+    genai = _FakeGenai()
+    first = GeminiPrefixCache.get_name(genai, "table", "m")
+    assert GeminiPrefixCache.get_name(genai, "table", "m") == first
+    monkeypatch.setattr(gemini_client, "_configured_key", "key-b")
+    assert GeminiPrefixCache.get_name(genai, "table", "m") != first
+    assert genai.created == ["m", "m"]
+
+
+def test_short_prefix_is_not_cached(monkeypatch):
+    _reset(monkeypatch, "key-a")
+    monkeypatch.setattr(gemini_cache, "MIN_CACHE_TOKENS", 2048)
+    genai = _FakeGenai()
+    assert GeminiPrefixCache.get_name(genai, "document", "m") is None
+    assert genai.created == []
+
+
+def test_prefix_cache_failure_is_retried_later(monkeypatch):
+    _reset(monkeypatch, "key-a")
+    genai = _FakeGenai()
+    genai.fail = True
+    assert GeminiPrefixCache.get_name(genai, "slides", "m") is None
+    assert GeminiPrefixCache.get_name(genai, "slides", "m") is None
+    assert genai.created == ["m"]
+
+    # Once the retry delay has passed, the next call tries again
+    genai.fail = False
+    now = time.time()
+    monkeypatch.setattr(gemini_cache.time, "time", lambda: now + gemini_cache._RETRY_SECONDS + 1)
+    assert GeminiPrefixCache.get_name(genai, "slides", "m") is not None
+    assert genai.created == ["m", "m"]
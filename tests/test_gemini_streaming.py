@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import time
+
+from office_ai_agent.agents import base_agent
+from office_ai_agent.agents.presentation_agent import PresentationAgent
+from office_ai_agent.core.config import Config
+
+_PAYLOAD = json.dumps({"slides": [{"title": "A", "bullets": ["x"]}]})
+
+
+class _Chunk:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class _FakeModel:
+    def __init__(self, name: str, first_delay: float = 0.0, step: float = 0.0) -> None:
+        self.name = name
+        self.first_delay = first_delay
+        self.step = step
+        self.consumed_past_json = False
+        self.consumed = 0
+
+    def generate_content(self, prompt, stream=False):
+        def gen():
+            time.sleep(self.first_delay)
+            self.consumed += 1
+            yield _Chunk("```json\n")
+            for i in range(0, len(_PAYLOAD), 8):
+                time.sleep(self.step)
+                self.consumed += 1
+                yield _Chunk(_PAYLOAD[i:i + 8])
+            self.consumed_past_json = True
+            yield _Chunk("\n``` trailing {junk")
+
+        return gen()
+
+
+def _agent(monkeypatch, models, stagger_ms=2000):
+    cfg = Config()
+    cfg.llm.hedge_stagger_ms = stagger_ms
+    agent = PresentationAgent(config=cfg)
+    monkeypatch.setattr(base_agent, "gemini_model", lambda genai, kind, name, primary: (models[name], False))
+    return agent
+
+
+def test_generation_stops_at_first_balanced_object(monkeypatch):
+    model = _FakeModel("m")
+    agent = _agent(monkeypatch, {"m": model})
+    data = agent._generate_with_fallbacks(None, "slides", ["m"], "m", "prompt", "tail")
+    assert data == json.loads(_PAYLOAD)
+    assert not model.consumed_past_json
+
+
+def test_hedged_attempts_stream_one_model_only(monkeypatch):
+    # "a" is slow to its first chunk, so "b" is launched as a hedge; both then stream
+    models = {"a": _FakeModel("a", first_delay=0.1, step=0.01), "b": _FakeModel("b", first_delay=0.12, step=0.01)}
+    agent = _agent(monkeypatch, models, stagger_ms=20)
+    events = []
+    agent._stream.sink = events.append
+    try:
+        data = agent._generate_with_fallbacks(None, "slides", ["a", "b"], "a", "prompt", "tail")
+    finally:
+        agent._stream.sink = None
+    chunks = [e for e in events if e["event"] == "llm_chunk"]
+    assert data == json.loads(_PAYLOAD)
+    assert len({e["model"] for e in chunks}) == 1
+    assert json.loads("".join(e["delta"] for e in chunks).split("\n", 1)[1]) == data
+
+
+
+def test_losing_attempt_stops_reading(monkeypatch):
+    # "a" streams first but slowly; hedge "b" finishes first
+    models = {"a": _FakeModel("a", first_delay=0.05, step=0.05), "b": _FakeModel("b", first_delay=0.06)}
+    agent = _agent(monkeypatch, models, stagger_ms=20)
+    data = agent._generate_with_fallbacks(None, "slides", ["a", "b"], "a", "prompt", "tail")
+    time.sleep(0.3)
+    assert data == json.loads(_PAYLOAD)
+    # The loser stopped reading its stream at the next chunk
+    assert models["a"].consumed <= 3
+
+
+def test_losing_owner_is_reset_and_silenced(monkeypatch):
+    # "a" streams first, so it owns llm_chunk, but hedge "b" wins
+    models = {"a": _FakeModel("a", first_delay=0.05, step=0.05), "b": _FakeModel("b", first_delay=0.06)}
+    agent = _agent(monkeypatch, models, stagger_ms=20)
+    events = []
+    agent._stream.sink = events.append
+    try:
+        agent._generate_with_fallbacks(None, "slides", ["a", "b"], "a", "prompt", "tail")
+        seen = len(events)
+        time.sleep(0.3)
+    finally:
+        agent._stream.sink = None
+    # Nothing is forwarded once the result is decided, and the owner's deltas are discarded
+    assert len(events) == seen
+    assert {e["model"] for e in events if e["event"] == "llm_chunk"} == {"a"}
+    assert events[-1] == {"event": "llm_reset", "agent": agent.name, "model": "a"}
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from office_ai_agent.core.hedging import first_success
+
+
+def test_first_success_hedges_slow_primary():
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return "slow"
+
+    try:
+        assert first_success([slow, lambda: "fast"], stagger_seconds=0.05) == "fast"
+    finally:
+        release.set()
+
+
+def test_first_success_falls_through_failures():
+    def boom():
+        raise RuntimeError("boom")
+
+    assert first_success([boom, lambda: "ok"], stagger_seconds=10) == "ok"
+    with pytest.raises(RuntimeError):
+        first_success([boom, boom], stagger_seconds=0.01)
+
+
+def test_first_success_no_hedge_once_started():
+    started = threading.Event()
+    launched = []
+
+    def streaming():
+        launched.append("primary")
+        started.set()  # first chunk arrived quickly; completion is slow
+        time.sleep(0.2)
+        return "primary"
+
+    def hedge():
+        launched.append("hedge")
+        return "hedge"
+
+    assert first_success([streaming, hedge], stagger_seconds=0.02, started=started) == "primary"
+    assert launched == ["primary"]
+
+
+def test_first_success_caps_in_flight():
+    release = threading.Event()
+    running = []
+
+    def slow(i):
+        running.append(i)
+        release.wait(5)
+        return i
+
+    calls = [lambda i=i: slow(i) for i in range(4)]
+    t = threading.Timer(0.2, release.set)
+    t.start()
+    try:
+        assert first_success(calls, stagger_seconds=0.01, max_in_flight=2) in (0, 1)
+        assert sorted(running) == [0, 1]
+    finally:
+        release.set()
+        t.cancel()
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from office_ai_agent.utils.json_extract import extract_first_json_object
+
+
+def test_extract_plain_and_embedded_objects():
+    assert extract_first_json_object('{"a": 1}') == {"a": 1}
+    text = 'Sure! Here it is:\n```json\n{"slides": [{"title": "A {b}", "bullets": ["x \\" }"]}]}\n```\nMore {text}'
+    assert extract_first_json_object(text) == {"slides": [{"title": "A {b}", "bullets": ['x " }']}]}
+
+
+def test_extract_returns_none_for_invalid_input():
+    assert extract_first_json_object("no json here") is None
+    assert extract_first_json_object('{"unterminated": [1, 2') is None
+    assert extract_first_json_object("[1, 2, 3]") is None
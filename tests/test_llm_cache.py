@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from office_ai_agent.agents import spreadsheet_agent
+from office_ai_agent.agents.spreadsheet_agent import SpreadsheetAgent
+from office_ai_agent.core import llm_cache
+from office_ai_agent.core.gemini_cache import PREFIXES
+from office_ai_agent.core.llm_cache import LLMCache
+
+
+def _slides_prompt(title: str, n: int, task: str) -> str:
+    # Same shape as PresentationAgent builds
+    return PREFIXES["slides"] + f"Title: {title}\nN: {n}\nTask: {task}"
+
+
+def test_llm_cache_exact_and_semantic(tmp_path: Path):
+    cache = LLMCache(path=tmp_path / "llm_cache")
+    task = "Create an outline with up to 3 slides about renewable energy trends in Europe"
+    title = "renewable energy trends in Europe"
+    prompt = _slides_prompt(title, 3, task)
+    scope = f"slides\0{title}"
+    value = [{"title": "Solar", "bullets": ["growth"]}]
+
+    assert cache.get("gemini-1.5-pro", prompt, scope=scope, text=task) is None
+    cache.put("gemini-1.5-pro", prompt, value, scope=scope, text=task)
+
+    # exact (whitespace-normalized) hit
+    assert cache.get("gemini-1.5-pro", "  " + prompt.replace(" ", "  ")) == value
+    # semantic hit on a rephrased task with the same title
+    task2 = task + " please"
+    assert cache.get("gemini-1.5-pro", _slides_prompt(title, 3, task2), scope=scope, text=task2) == value
+    # no semantic tier without a scope, different numbers or model never hit
+    assert cache.get("gemini-1.5-pro", _slides_prompt(title, 3, task2)) is None
+    task5 = task.replace("3", "5")
+    assert cache.get("gemini-1.5-pro", _slides_prompt(title, 5, task5), scope=scope, text=task5) is None
+    assert cache.get("gemini-2.0-flash", prompt) is None
+
+    # persisted across instances
+    assert LLMCache(path=tmp_path / "llm_cache").get("gemini-1.5-pro", prompt) == value
+
+
+def test_llm_cache_different_topics_miss(tmp_path: Path):
+    cache = LLMCache(path=tmp_path / "llm_cache")
+    cache.put(
+        "m",
+        _slides_prompt("cats", 3, "Create a 3 slide presentation about cats"),
+        [{"title": "Cats", "bullets": []}],
+        scope="slides\0cats",
+        text="Create a 3 slide presentation about cats",
+    )
+    for topic in ("dogs", "quarterly revenue"):
+        task = f"Create a 3 slide presentation about {topic}"
+        got = cache.get("m", _slides_prompt(topic, 3, task), scope=f"slides\0{topic}", text=task)
+        assert got is None, topic
+
+
+def test_llm_cache_one_word_difference_misses(tmp_path: Path):
+    cache = LLMCache(path=tmp_path / "llm_cache")
+    scope = "table\0Generated Sheet"
+    sales = "Create a spreadsheet listing the monthly sales figures for each of our regional offices in the last year"
+    expense = sales.replace("sales", "expense")
+    prompt = PREFIXES["table"] + f"Title: Generated Sheet\nTask: {sales}"
+    cache.put("m", prompt, {"headers": ["Month", "Sales"], "rows": []}, scope=scope, text=sales)
+
+    got = cache.get("m", PREFIXES["table"] + f"Title: Generated Sheet\nTask: {expense}", scope=scope, text=expense)
+    assert got is None
+
+
+def test_default_title_skips_semantic_tier(tmp_path: Path, monkeypatch):
+    seen = []
+
+    class _Cache:
+        def get(self, model, prompt, *, scope=None, text=None):
+            seen.append(scope)
+
+        def put(self, model, prompt, value, *, scope=None, text=None):
+            seen.append(scope)
+
+    monkeypatch.setenv("GEMINI_API_KEY", "k")
+    monkeypatch.setattr(spreadsheet_agent, "get_genai", lambda key: None)
+    agent = SpreadsheetAgent()
+    monkeypatch.setattr(agent, "_llm_cache", lambda: _Cache())
+    monkeypatch.setattr(agent, "_generate_with_fallbacks", lambda *a: {"headers": ["A"], "rows": []})
+
+    agent._generate_table_with_gemini("Create a spreadsheet", spreadsheet_agent.DEFAULT_TITLE)
+    agent._generate_table_with_gemini("Create a spreadsheet about sales", "sales")
+    assert seen == [None, None, "table\0sales", "table\0sales"]
+
+
+def test_llm_cache_ttl_expiry(tmp_path: Path):
+    cache = LLMCache(path=tmp_path / "llm_cache", ttl_seconds=-1)
+    cache.put("m", "hello world", {"a": 1})
+    assert cache.get("m", "hello world") is None
+
+
+def test_get_llm_cache_unavailable_returns_none(tmp_path: Path, monkeypatch):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("x")
+    monkeypatch.setattr(llm_cache, "DEFAULT_CACHE_DIR", blocker / "llm_cache")
+    llm_cache.get_llm_cache.cache_clear()
+    try:
+        assert llm_cache.get_llm_cache(60) is None
+    finally:
+        llm_cache.get_llm_cache.cache_clear()
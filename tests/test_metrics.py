@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from office_ai_agent.utils.metrics import Metrics
+
+
+def test_metrics_snapshot_is_plain_primitives():
+    m = Metrics()
+    m.inc("calls")
+    m.inc("calls", 2)
+    with m.timer("work"):
+        pass
+    with m.timer("work"):
+        pass
+
+    snap = m.snapshot()
+    assert snap["counters"] == {"calls": 3}
+    work = snap["timers"]["work"]
+    assert work["count"] == 2
+    assert type(work["total"]) is float and type(work["avg"]) is float
+    assert work["total"] >= 0.0 and work["avg"] == work["total"] / 2
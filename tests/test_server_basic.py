@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
+import time
+
+import pytest
 from fastapi.testclient import TestClient
 
+from office_ai_agent import server
+from office_ai_agent.core import agent_orchestrator
 from office_ai_agent.server import app
 
 
@@ -22,3 +30,71 @@ def test_server_agents_and_execute(monkeypatch, tmp_path):
     data2 = r2.json()
     assert data2.get("status") == "completed"
     assert isinstance(data2.get("result"), dict)
+
+
+def test_server_execute_stream_events(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    client = TestClient(app)
+
+    with client.stream("GET", "/execute_stream", params={"task": "Create a 2-slide presentation about tests"}) as r:
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/event-stream")
+        events = [json.loads(line[6:]) for line in r.iter_lines() if line.startswith("data: ")]
+    names = [e["event"] for e in events]
+    assert names[0] == "start" and names[-1] == "end"
+    assert names.count("slide_added") == 2
+
+
+def test_server_execute_stream_event_source(monkeypatch, tmp_path):
+    pytest.importorskip("sse_starlette")
+    monkeypatch.chdir(tmp_path)
+    assert server.EventSourceResponse is not None
+    client = TestClient(app)
+
+    with client.stream("GET", "/execute_stream", params={"task": "Create a 2-slide presentation about tests"}) as r:
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/event-stream")
+        assert r.headers["x-accel-buffering"] == "no"
+        lines = list(r.iter_lines())
+    # Pre-framed batches pass through unchanged: one JSON event per data line
+    events = [json.loads(line[6:]) for line in lines if line.startswith("data: ")]
+    assert all(line.startswith(("data: ", ": ping")) for line in lines if line)
+    names = [e["event"] for e in events]
+    assert names[0] == "start" and names[-1] == "end"
+    assert names.count("slide_added") == 2
+
+
+class _FakeOrchestrator:
+    builds = []
+
+    def __init__(self, config=None):
+        try:
+            asyncio.get_running_loop()
+            on_loop = True
+        except RuntimeError:
+            on_loop = False
+        time.sleep(0.05)
+        self.builds.append(on_loop)
+        self.agents = {"document": None}
+
+    def execute(self, task, context=None, user_id=None, task_id=None):
+        return {"status": "completed", "result": {"task": task}}
+
+
+def test_server_builds_one_orchestrator_off_the_loop(monkeypatch):
+    monkeypatch.setattr(server, "_AGENT", None)
+    monkeypatch.setattr(agent_orchestrator, "OfficeAIAgent", _FakeOrchestrator)
+    monkeypatch.setattr(_FakeOrchestrator, "builds", [])
+
+    r = TestClient(app).post("/execute", json={"task": "t"})
+    assert r.status_code == 200 and r.json()["result"] == {"task": "t"}
+    assert _FakeOrchestrator.builds == [False]
+
+    # Racing first calls (threadpool and SSE producer threads) share one build
+    monkeypatch.setattr(server, "_AGENT", None)
+    threads = [threading.Thread(target=server._agent) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert _FakeOrchestrator.builds == [False, False]
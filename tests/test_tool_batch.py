@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from office_ai_agent.agents.spreadsheet_agent import SpreadsheetAgent
+from office_ai_agent.core.config import Config
+from office_ai_agent.tools import simple_tools
+from office_ai_agent.tools.office_tools import Tool
+
+
+def _flaky(n: int) -> dict:
+    if n == 1:
+        raise ValueError("boom")
+    if n == 2:
+        return {"status": "error", "error": "bad input"}
+    return {"status": "ok"}
+
+
+def test_run_tool_batch_collects_errors_serially():
+    agent = SpreadsheetAgent()
+    order = []
+    tool = Tool(name="flaky", description="", func=lambda n: order.append(n) or _flaky(n))
+    errors = agent._run_tool_batch(tool, [{"n": i} for i in range(4)])
+    assert order == [0, 1, 2, 3]
+    assert errors == [
+        {"event": "error", "tool": "flaky", "args": {"n": 1}, "error": "boom"},
+        {"event": "error", "tool": "flaky", "args": {"n": 2}, "error": "bad input"},
+    ]
+
+
+def test_run_tool_batch_parallel_for_thread_safe_tools(monkeypatch):
+    monkeypatch.setenv("TOOL_CONCURRENCY_LIMIT", "4")
+    cfg = Config()
+    cfg.flags.parallel_tools = True
+    agent = SpreadsheetAgent(config=cfg)
+    threads = set()
+
+    def slow(n: int) -> dict:
+        threads.add(threading.get_ident())
+        time.sleep(0.05)
+        return _flaky(n)
+
+    tool = Tool(name="slow", description="", func=slow, thread_safe=True)
+    t0 = time.perf_counter()
+    errors = agent._run_tool_batch(tool, [{"n": i} for i in range(4)])
+    assert time.perf_counter() - t0 < 0.15
+    assert len(threads) > 1
+    # Errors keep call order regardless of completion order
+    assert [e["args"] for e in errors] == [{"n": 1}, {"n": 2}]
+
+    # Not thread-safe: serial on the caller's thread even with the flag set
+    threads.clear()
+    agent._run_tool_batch(Tool(name="slow", description="", func=slow), [{"n": 0}, {"n": 3}])
+    assert threads == {threading.get_ident()}
+
+
+def test_spreadsheet_round_trip_through_bulk_write(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    agent = SpreadsheetAgent()
+    monkeypatch.setattr(
+        agent, "_generate_table_with_gemini",
+        lambda task, title: {"headers": ["Month", "Sales"], "rows": [["Jan", 10], ["Feb", 12]]},
+    )
+    calls = []
+    bulk = agent._tool_map["write_cells_bulk"]
+    monkeypatch.setitem(
+        agent._tool_map, "write_cells_bulk",
+        Tool(name=bulk.name, description="", func=lambda **kw: calls.append(kw) or bulk(**kw)),
+    )
+
+    result = agent.execute("Create a spreadsheet about sales")
+    assert len(calls) == 1 and len(calls[0]["cells"]) == 6
+    assert "errors" not in result
+    path = Path(result["file_path"])
+    if path.suffix == ".txt":
+        assert path.read_text().splitlines() == ["Month\tSales", "Jan\t10", "Feb\t12"]
+    else:
+        assert path.exists()
+
+
+def test_spreadsheet_reports_bulk_write_errors(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    agent = SpreadsheetAgent()
+    monkeypatch.setattr(agent, "_generate_table_with_gemini", lambda task, title: None)
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(simple_tools, "_set_cell", fail)
+
+    result = agent.execute("Create a spreadsheet about sales")
+    assert result["status"] == "ok"
+    assert [e["error"] for e in result["errors"]] == ["disk full"]
+    assert result["errors"][0]["tool"] == "write_cells_bulk"
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from office_ai_agent.tools.office_tools import OfficeToolRegistry
+import pytest
+
+from office_ai_agent.agents.base_agent import ToolNotFoundError
+from office_ai_agent.agents.document_agent import DocumentAgent
+from office_ai_agent.tools import simple_tools
+from office_ai_agent.tools.office_tools import OfficeToolRegistry, get_registry
 
 
 def test_tools_registry_basic_document(tmp_path: Path, monkeypatch):
@@ -22,3 +27,48 @@ def test_tools_registry_basic_document(tmp_path: Path, monkeypatch):
     out = save(doc_id=doc_id)
     path = Path(out["file_path"])
     assert path.exists(), f"Expected output document at {path}"
+
+
+def test_get_registry_is_shared():
+    reg = get_registry()
+    assert reg is get_registry()
+    names = [t.name for t in reg.get_all_tools()]
+    assert "write_cells_bulk" in names and len(names) == len(set(names))
+
+
+def test_agent_missing_tool_attribute():
+    agent = DocumentAgent()
+    assert callable(agent._t_create_document)
+    assert not hasattr(agent, "_t_missing")
+    assert getattr(agent, "_t_missing", None) is None
+    with pytest.raises(ToolNotFoundError, match="tool not found: missing"):
+        agent._t_missing
+
+
+def test_claim_id_suffixes_and_reuses_freed_ids(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(simple_tools, "_DOC_SESSIONS", {})
+    monkeypatch.setattr(simple_tools, "_DOC_COUNTERS", {})
+
+    ids = [simple_tools.create_document("Quarterly Report")["doc_id"] for _ in range(3)]
+    base = ids[0]
+    assert ids == [base, f"{base}_1", f"{base}_2"]
+
+    assert simple_tools.save_document(base)["status"] == "ok"
+    assert simple_tools.create_document("Quarterly Report")["doc_id"] == base
+    assert simple_tools.create_document("Quarterly Report")["doc_id"] == f"{base}_3"
+
+
+def test_walk_files_matches_glob_listing(tmp_path: Path):
+    top = tmp_path / "documents"
+    (top / "sub" / "deeper").mkdir(parents=True)
+    (top / "b.txt").write_text("b")
+    (top / ".hidden").write_text("h")
+    (top / "sub" / "a.docx").write_text("a")
+    (top / "sub" / "deeper" / "c.txt").write_text("c")
+    (top / "link.txt").symlink_to(top / "b.txt")
+    (top / "dangling").symlink_to(top / "missing")
+
+    expected = sorted(str(p) for p in top.glob("**/*") if p.is_file())
+    assert simple_tools._walk_files(str(top)) == expected
+    assert str(top / ".hidden") in expected and str(top / "link.txt") in expected